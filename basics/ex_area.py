@@ -4,6 +4,8 @@ This script calculates the area of a circle based on the given radius.
 
 import math
 
+import numpy as np
+
 def area(radius):
     """
     Calculate the area of a circle.
@@ -20,6 +22,25 @@ def area(radius):
     # :.2f round the value upto 2 digits
     return circ
 
+def area_batch(radii, quiet=False):
+    """
+    Calculate the area of many circles at once.
+
+    Args:
+        radii (array-like): Radii of the circles.
+        quiet (bool): Skip the per-circle print lines.
+
+    Returns:
+        numpy.ndarray: areas of the circles.
+    """
+    radii = np.asarray(radii, dtype=np.float64)
+    circ = np.square(radii)
+    circ *= np.pi  # in place for arrays; a 0-d input gives a scalar here
+    if not quiet:
+        for r, c in zip(np.ravel(radii), np.ravel(circ)):
+            print(f"area of circle with radius {r} is {c:.2f}")
+    return circ
+
 def main():
     """
     Main function to run the area calculation.
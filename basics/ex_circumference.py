@@ -4,6 +4,8 @@ This script calculates the circumference of a circle based on the given radius.
 
 import math
 
+import numpy as np
+
 def circumference(radius):
     """
     Calculate the circumference of a circle.
@@ -20,6 +22,24 @@ def circumference(radius):
     # :.2f round the value upto 2 digits
     return circ
 
+def circumference_batch(radii, quiet=False):
+    """
+    Calculate the circumference of many circles at once.
+
+    Args:
+        radii (array-like): Radii of the circles.
+        quiet (bool): Skip the per-circle print lines.
+
+    Returns:
+        numpy.ndarray: Circumferences of the circles.
+    """
+    radii = np.asarray(radii, dtype=np.float64)
+    circ = np.multiply(radii, 2 * math.pi)
+    if not quiet:
+        for r, c in zip(np.ravel(radii), np.ravel(circ)):
+            print(f"Circumference of circle with radius {r} is {c:.2f}")
+    return circ
+
 def main():
     """
     Main function to run the circumference calculation.
@@ -0,0 +1,123 @@
+"""
+This script runs the circle/triangle calculators over a whole file of inputs.
+
+Usage:
+    python ex_geometry_batch.py area radii.txt
+    python ex_geometry_batch.py circumference radii.txt -o out.txt
+    python ex_geometry_batch.py hypotenuse sides.csv --batch-size 100000
+    python ex_geometry_batch.py --benchmark 1000000
+
+Input has one radius per line (area, circumference) or two sides per line
+separated by a comma or whitespace (hypotenuse). The file is read and
+written in batches, so it can be larger than memory.
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+import time
+from itertools import islice
+
+import numpy as np
+
+from ex_area import area, area_batch
+from ex_circumference import circumference, circumference_batch
+from ex_hypotenuse import hypotenuse, hypotenuse_batch
+
+CALCULATORS = {
+    "area": (area_batch, 1),
+    "circumference": (circumference_batch, 1),
+    "hypotenuse": (hypotenuse_batch, 2),
+}
+
+
+def read_batches(lines, columns, batch_size):
+    """
+    Yield float arrays of shape (batch, columns) from an iterable of lines.
+    """
+    lines = (line.replace(",", " ") for line in lines if line.strip())
+    while True:
+        chunk = list(islice(lines, batch_size))
+        if not chunk:
+            return
+        values = np.loadtxt(chunk, dtype=np.float64, ndmin=2)
+        if values.shape[1] != columns:
+            raise ValueError(f"Expected {columns} column(s) per line, got {values.shape[1]}")
+        yield values
+
+
+def run(shape, src, dst, batch_size=65_536):
+    """
+    Stream `src` through the batch calculator and write one result per line.
+    """
+    func, columns = CALCULATORS[shape]
+    count = 0
+    for values in read_batches(src, columns, batch_size):
+        result = func(*values.T, quiet=True)
+        np.savetxt(dst, result, fmt="%.6f")
+        count += len(result)
+    return count
+
+
+def benchmark(n=1_000_000):
+    """
+    Compare the scalar functions in a Python loop with the batch versions.
+    """
+    print(f"Benchmark ({n:,} inputs)")
+
+    rng = np.random.default_rng(0)
+    a = rng.random(n) * 100
+    b = rng.random(n) * 100
+
+    cases = [
+        ("area", lambda: [area(r) for r in a], lambda: area_batch(a, quiet=True)),
+        ("circumference", lambda: [circumference(r) for r in a],
+         lambda: circumference_batch(a, quiet=True)),
+        ("hypotenuse", lambda: [hypotenuse(x, y) for x, y in zip(a, b)],
+         lambda: hypotenuse_batch(a, b, quiet=True)),
+    ]
+    for name, scalar_loop, batch in cases:
+        # The scalar functions print on every call; send that to /dev/null
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            expected = scalar_loop()
+            scalar_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = batch()
+        batch_s = time.perf_counter() - start
+
+        print(f"{name:<14} scalar loop {scalar_s:8.3f}s   batch {batch_s:8.4f}s   "
+              f"{scalar_s / batch_s:7.0f}x   match: {np.allclose(expected, result)}")
+
+
+def main():
+    """
+    Parse arguments and run the batch calculation or the benchmark.
+    """
+    parser = argparse.ArgumentParser(description="Batch circle/triangle calculator")
+    parser.add_argument("shape", nargs="?", choices=sorted(CALCULATORS))
+    parser.add_argument("input", nargs="?", default="-", help="input file ('-' for stdin)")
+    parser.add_argument("-o", "--output", default="-", help="output file ('-' for stdout)")
+    parser.add_argument("--batch-size", type=int, default=65_536)
+    parser.add_argument("--benchmark", type=int, metavar="N",
+                        help="time scalar loop vs batch on N random inputs")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+        return
+    if args.shape is None:
+        parser.error("shape is required unless --benchmark is given")
+
+    with contextlib.ExitStack() as stack:
+        src = sys.stdin if args.input == "-" else stack.enter_context(open(args.input))
+        dst = (sys.stdout.buffer if args.output == "-"
+               else stack.enter_context(open(args.output, "wb")))
+        count = run(args.shape, src, dst, args.batch_size)
+    print(f"Processed {count:,} rows", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
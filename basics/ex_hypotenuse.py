@@ -5,6 +5,8 @@ based on the two other side lengths provided by the user.
 
 import math
 
+import numpy as np
+
 def hypotenuse(size1, size2):
     """
     Calculate the hypotenuse of a right-angled triangle.
@@ -26,6 +28,28 @@ def hypotenuse(size1, size2):
     )
     return hypo
 
+def hypotenuse_batch(sizes1, sizes2, quiet=False):
+    """
+    Calculate the hypotenuse of many right-angled triangles at once.
+
+    Args:
+        sizes1 (array-like): First side of each triangle.
+        sizes2 (array-like): Second side of each triangle.
+        quiet (bool): Skip the per-triangle print lines.
+
+    Returns:
+        numpy.ndarray: Lengths of the hypotenuses.
+    """
+    # np.hypot avoids overflow/underflow in the intermediate squares
+    sizes1 = np.asarray(sizes1, dtype=np.float64)
+    sizes2 = np.asarray(sizes2, dtype=np.float64)
+    hypo = np.hypot(sizes1, sizes2)
+    if not quiet:
+        sizes1, sizes2 = np.broadcast_arrays(sizes1, sizes2)
+        for a, b, c in zip(np.ravel(sizes1), np.ravel(sizes2), np.ravel(hypo)):
+            print(f"Hypotenuse of triangle with sizes {a} and {b} is {c:.2f}")
+    return hypo
+
 def main():
     """
     Main function to run the hypotenuse calculation.
@@ -1,13 +1,27 @@
 """
 Covers:
 - Advanced slicing
+- Sorted, run-aware gather / scatter
 - Axis operations
+- Parallel, compensated axis reductions
 - Boolean masking
+- Reusable compact selections
 - Broadcasting
+- Lazy, block-fused broadcast expressions
 - Random sampling
 - Stacking & splitting
+- Growable array buffer (amortized appends)
+- Vectorization vs loop vs memmap benchmark
 """
 
+import operator
+import os
+import tempfile
+import time
+import tracemalloc
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
 # Advanced Slicing & Fancy Indexing
@@ -24,6 +38,167 @@ def slicing_and_indexing():
     print("-" * 40)
 
 
+# Gather / Scatter: read rows in memory order, copy contiguous runs as slices
+def _runs(sorted_idx):
+    """
+    Split sorted indices into runs of consecutive values: (starts, lengths).
+    """
+    breaks = np.flatnonzero(np.diff(sorted_idx) != 1) + 1
+    starts = np.concatenate([[0], breaks])
+    lengths = np.diff(np.concatenate([starts, [len(sorted_idx)]]))
+    return starts, lengths
+
+
+def _row_indices(indices, n):
+    """
+    Indices as intp in [0, n); negative ones wrap as in `arr[indices]`.
+    """
+    indices = np.asarray(indices, dtype=np.intp)
+    if len(indices) and (indices.min() < -n or indices.max() >= n):
+        bad = indices[(indices < -n) | (indices >= n)][0]
+        raise IndexError(f"index {bad} is out of bounds for axis 0 with size {n}")
+    return np.where(indices < 0, indices + n, indices)
+
+
+def gather_rows(arr, indices, out=None, min_run=8, sort=False):
+    """
+    `arr[indices]` for a large 2-D `arr`, optionally visiting rows in memory order.
+
+    By default this is one bounds-checked `np.take` into `out`. With
+    `sort=True` indices are sorted, runs of at least `min_run` consecutive
+    rows are copied as slices, the rest by fancy indexing, and the result
+    is put back in the caller's order. Sorting only helps when reads are
+    slow and sequential access matters (a cold memmap on disk); for data in
+    RAM or the page cache the plain take is faster (see `gather_benchmark`).
+    """
+    indices = _row_indices(indices, len(arr))
+    if out is None:
+        out = np.empty((len(indices),) + arr.shape[1:], dtype=arr.dtype)
+    if len(indices) == 0:
+        return out
+    # Indices are already checked, and mode="raise" with out= goes through a buffer
+    if not sort:
+        return np.take(arr, indices, axis=0, out=out, mode="clip")
+
+    presorted = len(indices) < 2 or bool(np.all(indices[1:] >= indices[:-1]))
+    if presorted:
+        # Fast path: already in memory order, gather straight into out
+        order, sorted_idx, gathered = None, indices, out
+    else:
+        order = np.argsort(indices)
+        sorted_idx = indices[order]
+
+    starts, lengths = _runs(sorted_idx)
+    long_runs = lengths >= min_run
+    if not long_runs.any():
+        # Nothing to copy as slices: one take in the caller's order, no un-permute
+        return np.take(arr, indices, axis=0, out=out, mode="clip")
+
+    if order is not None:
+        gathered = np.empty_like(out)
+    for start, length in zip(starts[long_runs], lengths[long_runs]):
+        first = sorted_idx[start]
+        gathered[start:start + length] = arr[first:first + length]
+
+    # Everything not covered by a long run, still in sorted (memory) order
+    short = np.flatnonzero(np.repeat(~long_runs, lengths))
+    gathered[short] = arr[sorted_idx[short]]
+
+    if order is not None:
+        out[order] = gathered  # un-permute
+    return out
+
+
+def scatter_rows(arr, indices, values, min_run=8):
+    """
+    `arr[indices] = values` with the same sorted, run-aware access pattern.
+
+    With duplicate indices the last value wins, as with plain fancy assignment.
+    """
+    indices = _row_indices(indices, len(arr))
+    if len(indices) == 0:
+        return arr
+    values = np.broadcast_to(values, (len(indices),) + arr.shape[1:])
+    order = np.argsort(indices, kind="stable")
+    sorted_idx = indices[order]
+    sorted_vals = values[order]
+
+    # Keep only the last write to each row
+    last = np.concatenate([sorted_idx[1:] != sorted_idx[:-1], [True]])
+    sorted_idx, sorted_vals = sorted_idx[last], sorted_vals[last]
+
+    starts, lengths = _runs(sorted_idx)
+    long_runs = lengths >= min_run
+    for start, length in zip(starts[long_runs], lengths[long_runs]):
+        first = sorted_idx[start]
+        arr[first:first + length] = sorted_vals[start:start + length]
+
+    short = np.flatnonzero(np.repeat(~long_runs, lengths))
+    arr[sorted_idx[short]] = sorted_vals[short]
+    return arr
+
+
+def gather_scatter_demo():
+    print("Sorted Gather / Scatter")
+
+    arr = np.array([[10, 20, 30], [40, 50, 60], [70, 80, 90]])
+    idx = np.array([2, 0, 1, 2])
+    print("Gather rows [2, 0, 1, 2]:\n", gather_rows(arr, idx, min_run=2, sort=True))
+    print("Same as arr[idx]:", np.array_equal(gather_rows(arr, idx, min_run=2, sort=True), arr[idx]))
+
+    target = np.zeros_like(arr)
+    scatter_rows(target, np.array([1, 0]), arr[:2], min_run=2)
+    print("Scatter rows 0,1 into [1, 0]:\n", target)
+    print("-" * 40)
+
+
+def gather_benchmark(rows=2_000_000, cols=32, picks=1_000_000):
+    """
+    Fancy indexing vs gather_rows (take / sorted) for random and clustered
+    indices, on an in-memory array and on the same data as a memmap.
+
+    The memmap file was just written, so it is usually in the page cache;
+    drop the cache first to see cold-disk behaviour.
+    """
+    print(f"Gather Benchmark ({picks:,} of {rows:,} rows x {cols})")
+
+    rng = np.random.default_rng(0)
+    arr = rng.random((rows, cols), dtype=np.float32)
+
+    random_idx = rng.integers(0, rows, picks)
+    # Clustered: short runs of consecutive rows starting at random offsets
+    starts = rng.integers(0, rows - 64, picks // 64)
+    clustered = (starts[:, None] + np.arange(64)).ravel()
+    rng.shuffle(clustered.reshape(-1, 64))   # shuffle clusters, keep runs intact
+
+    patterns = [("random", random_idx), ("clustered", clustered),
+                ("sorted", np.sort(random_idx)), ("sorted runs", np.sort(clustered))]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "rows.bin")
+        arr.tofile(path)
+        mapped = np.memmap(path, dtype=arr.dtype, mode="r", shape=arr.shape)
+        for source, data in [("memory", arr), ("memmap", mapped)]:
+            for name, idx in patterns:
+                start = time.perf_counter()
+                expected = data[idx]
+                naive_s = time.perf_counter() - start
+
+                start = time.perf_counter()
+                result = gather_rows(data, idx)
+                take_s = time.perf_counter() - start
+
+                start = time.perf_counter()
+                sorted_result = gather_rows(data, idx, sort=True)
+                sorted_s = time.perf_counter() - start
+
+                match = np.array_equal(expected, result) and np.array_equal(expected, sorted_result)
+                print(f"{source:<7} {name:<12} fancy {naive_s:7.3f}s   take {take_s:7.3f}s   "
+                      f"sorted {sorted_s:7.3f}s   match: {match}")
+        del mapped
+    print("-" * 40)
+
+
 # Broadcasting (auto shape alignment)
 def broadcasting_demo():
     print("Broadcasting Example")
@@ -39,6 +214,149 @@ def broadcasting_demo():
     print("-" * 40)
 
 
+# Lazy Expressions: record broadcasted ops, evaluate fused block by block
+class Lazy:
+    """
+    A deferred elementwise expression over broadcastable arrays.
+
+    Arithmetic on `Lazy` objects only records the operation. `evaluate()`
+    walks the output in blocks of rows; each block's inputs are broadcast
+    views, so temporaries are block-sized and the result goes straight
+    into one output buffer.
+    """
+
+    _UFUNCS = {"+": np.add, "-": np.subtract, "*": np.multiply, "/": np.true_divide}
+
+    def __init__(self, value=None, op=None, left=None, right=None):
+        self.value = value
+        self.op = op
+        self.left = left
+        self.right = right
+        if op is None:
+            self.shape = np.shape(value)
+            self.dtype = np.asarray(value).dtype
+            # Python scalars stay "weak" (NEP 50): float32 * 2.0 is float32
+            self._weak = type(value) in (bool, int, float, complex)
+            self._operand = value if self._weak else self.dtype
+        else:
+            self.shape = np.broadcast_shapes(left.shape, right.shape)
+            self._weak = False
+            self.dtype = np.result_type(left._operand, right._operand)
+            if op == "/" and self.dtype.kind not in "fc":
+                self.dtype = np.dtype(np.float64)   # true division of ints/bools
+            self._operand = self.dtype
+
+    @staticmethod
+    def _wrap(x):
+        return x if isinstance(x, Lazy) else Lazy(x)
+
+    def _binary(self, op, other, reverse=False):
+        other = self._wrap(other)
+        return Lazy(op=op, left=other, right=self) if reverse else Lazy(op=op, left=self, right=other)
+
+    def __add__(self, other):
+        return self._binary("+", other)
+
+    def __radd__(self, other):
+        return self._binary("+", other, reverse=True)
+
+    def __sub__(self, other):
+        return self._binary("-", other)
+
+    def __rsub__(self, other):
+        return self._binary("-", other, reverse=True)
+
+    def __mul__(self, other):
+        return self._binary("*", other)
+
+    def __rmul__(self, other):
+        return self._binary("*", other, reverse=True)
+
+    def __truediv__(self, other):
+        return self._binary("/", other)
+
+    def __rtruediv__(self, other):
+        return self._binary("/", other, reverse=True)
+
+    def _eval_block(self, shape, rows, out=None):
+        if self.op is None:
+            if self._weak:
+                value = self.value   # the ufunc broadcasts it and keeps it weak
+            else:
+                value = np.broadcast_to(self.value, shape)   # a view, no copy
+                value = value[rows] if value.ndim else value
+            if out is not None:
+                out[...] = value
+                return out
+            return value
+        left = self.left._eval_block(shape, rows)
+        right = self.right._eval_block(shape, rows)
+        if (out is None and self.left.op is not None and left.dtype == self.dtype
+                and left.shape == np.broadcast_shapes(left.shape, np.shape(right))):
+            out = left  # reuse our own intermediate instead of allocating another
+        return self._UFUNCS[self.op](left, right, out=out)
+
+    def evaluate(self, out=None, block_rows=65_536):
+        shape = self.shape
+        if out is None:
+            out = np.empty(shape, dtype=self.dtype)
+        if not shape:
+            out[...] = self._eval_block(shape, ())
+            return out
+        for start in range(0, shape[0], block_rows):
+            rows = slice(start, start + block_rows)
+            self._eval_block(shape, rows, out=out[rows])
+        return out
+
+
+def lazy_expression_demo():
+    print("Lazy Broadcast Expressions")
+
+    a = Lazy(np.array([[1], [2], [3]]))     # shape (3, 1)
+    b = Lazy(np.array([10, 20, 30]))        # shape (3,)
+    expr = ((a + b) * 2 - 1) / 4
+
+    print("Expression shape:", expr.shape)
+    print("Fused result:\n", expr.evaluate(block_rows=2))
+    print("Matches eager:", np.allclose(expr.evaluate(), ((a.value + b.value) * 2 - 1) / 4))
+    print("-" * 40)
+
+
+def lazy_memory_benchmark(rows=10_000, cols=10_000, block_rows=256):
+    """
+    Peak traced memory and time for ((a + b) * c - d) / e, eager vs fused.
+    """
+    print(f"Lazy vs Eager ({rows:,} x {cols:,} broadcast result)")
+
+    rng = np.random.default_rng(0)
+    a = rng.random((rows, 1))
+    b = rng.random(cols)
+    c = rng.random((rows, 1))
+    d = rng.random(cols)
+    e = rng.random((rows, 1)) + 1
+    out = np.empty((rows, cols))
+    result_mb = out.nbytes / 1e6
+
+    def measure(fn):
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = fn()
+        seconds = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return seconds, peak / 1e6, result
+
+    eager_s, eager_peak, eager = measure(lambda: ((a + b) * c - d) / e)
+    del eager
+    expr = ((Lazy(a) + b) * c - d) / e
+    lazy_s, lazy_peak, _ = measure(lambda: expr.evaluate(out=out, block_rows=block_rows))
+
+    print(f"Result buffer:  {result_mb:9.1f} MB")
+    print(f"Eager NumPy:    {eager_s:8.3f}s   peak {eager_peak:9.1f} MB")
+    print(f"Lazy (fused):   {lazy_s:8.3f}s   peak {lazy_peak:9.1f} MB (plus the out buffer)")
+    print("-" * 40)
+
+
 # Boolean Masking & Filtering
 def boolean_masking():
     print("Boolean Masking")
@@ -51,6 +369,122 @@ def boolean_masking():
     print("-" * 40)
 
 
+# Selection: compute a mask once, store it compactly, apply it to many columns
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+_BIT = np.array([0x80 >> i for i in range(8)], dtype=np.uint8)
+
+
+def _indices_to_bits(indices, n):
+    bits = np.zeros((n + 7) // 8, dtype=np.uint8)
+    np.bitwise_or.at(bits, indices >> 3, _BIT[indices & 7])
+    return bits
+
+
+def _bits_to_indices(bits):
+    # Only expand the non-zero bytes, never the whole mask
+    nonzero = np.flatnonzero(bits)
+    expanded = np.unpackbits(bits[nonzero]).reshape(-1, 8).astype(bool)
+    positions = nonzero[:, None] * 8 + np.arange(8)
+    return positions[expanded].astype(np.int32)
+
+
+class Selection:
+    """
+    A row selection over arrays of length `n`.
+
+    Stored as sorted int32 indices or as packed bits, whichever is smaller.
+    `apply()` gathers with `np.take(..., out=)`, and selections combine with
+    `&`, `|`, `~` without going back to a full boolean array.
+    """
+
+    def __init__(self, n, indices=None, bits=None):
+        self.n = n
+        self._indices = indices
+        self.bits = bits
+        self._compact()
+
+    @classmethod
+    def from_mask(cls, mask):
+        mask = np.asarray(mask, dtype=bool)
+        return cls(len(mask), indices=np.flatnonzero(mask).astype(np.int32))
+
+    def _count(self):
+        if self._indices is not None:
+            return len(self._indices)
+        return int(_POPCOUNT[self.bits].sum(dtype=np.int64))
+
+    def _compact(self):
+        packed_bytes = (self.n + 7) // 8
+        sparse = self._count() * 4 <= packed_bytes
+        if sparse and self._indices is None:
+            self._indices, self.bits = _bits_to_indices(self.bits), None
+        elif not sparse and self.bits is None:
+            self.bits, self._indices = _indices_to_bits(self._indices, self.n), None
+
+    @property
+    def kind(self):
+        return "indices" if self._indices is not None else "bits"
+
+    @property
+    def nbytes(self):
+        return (self._indices if self._indices is not None else self.bits).nbytes
+
+    @property
+    def indices(self):
+        return self._indices if self._indices is not None else _bits_to_indices(self.bits)
+
+    def __len__(self):
+        return self._count()
+
+    def _as_bits(self):
+        return self.bits if self.bits is not None else _indices_to_bits(self._indices, self.n)
+
+    def __and__(self, other):
+        if self._indices is not None and other._indices is not None:
+            return Selection(self.n, indices=np.intersect1d(self._indices, other._indices,
+                                                            assume_unique=True))
+        return Selection(self.n, bits=self._as_bits() & other._as_bits())
+
+    def __or__(self, other):
+        if self._indices is not None and other._indices is not None:
+            return Selection(self.n, indices=np.union1d(self._indices, other._indices))
+        return Selection(self.n, bits=self._as_bits() | other._as_bits())
+
+    def __invert__(self):
+        bits = ~self._as_bits()
+        if self.n % 8:
+            bits[-1] &= np.uint8(0xFF << (8 - self.n % 8) & 0xFF)  # clear padding
+        return Selection(self.n, bits=bits)
+
+    def apply(self, arr, out=None):
+        if len(arr) != self.n:
+            raise ValueError(f"selection is for length {self.n}, got {len(arr)}")
+        return np.take(arr, self.indices, axis=0, out=out)
+
+    def apply_many(self, arrays):
+        idx = self.indices  # decode once for all columns
+        return [np.take(a, idx, axis=0) for a in arrays]
+
+
+def selection_demo():
+    print("Selection (compact reusable mask)")
+
+    arr = np.array([5, 10, 15, 20, 25])
+    other = np.array([0.5, 1.0, 1.5, 2.0, 2.5])
+
+    big = Selection.from_mask(arr > 12)
+    even = Selection.from_mask(arr % 2 == 0)
+    print("Stored as:", big.kind, big.indices)
+    print("Filtered:", big.apply(arr), "| other column:", big.apply(other))
+    print("> 12 and even:", (big & even).apply(arr))
+    print("not > 12:", (~big).apply(arr))
+
+    out = np.empty(len(big), dtype=other.dtype)
+    big.apply(other, out=out)
+    print("Into preallocated out=:", out)
+    print("-" * 40)
+
+
 # Axis-Based Operations
 def axis_operations():
     print("Axis Operations")
@@ -61,6 +495,144 @@ def axis_operations():
     print("-" * 40)
 
 
+# Parallel Reductions: split along the kept axis, reduce chunks on threads
+def _compensated_sum(a, axis, block):
+    """
+    Kahan-compensated sum over `axis`, adding one block of `block` slices at a time.
+
+    Each block is summed by NumPy (pairwise where it can); the running total
+    carries a correction term so float32 doesn't drift over many blocks.
+    """
+    # Zeros of the reduced shape, so an empty axis sums to 0 as in np.sum
+    empty = [slice(None)] * a.ndim
+    empty[axis] = slice(0, 0)
+    total = a[tuple(empty)].sum(axis=axis)
+    comp = np.zeros_like(total)
+    for start in range(0, a.shape[axis], block):
+        index = [slice(None)] * a.ndim
+        index[axis] = slice(start, start + block)
+        partial = a[tuple(index)].sum(axis=axis)
+        y = partial - comp
+        t = total + y
+        comp = (t - total) - y
+        total = t
+    return total
+
+
+def _reduce_chunk(chunk, op, axis, block, ddof):
+    if op == "min":
+        return chunk.min(axis=axis)
+    if op == "max":
+        return chunk.max(axis=axis)
+    n = chunk.shape[axis]
+    total = _compensated_sum(chunk, axis, block)
+    if op == "sum":
+        return total
+    # n or n - ddof may be 0: NaN/inf as in NumPy; parallel_reduce warns once
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = total / chunk.dtype.type(n)
+        if op == "mean":
+            return mean
+        centered = chunk - np.expand_dims(mean, axis)   # one chunk-sized temporary
+        np.square(centered, out=centered)
+        return _compensated_sum(centered, axis, block) / chunk.dtype.type(n - ddof)
+
+
+def parallel_reduce(arr, op="sum", axis=0, out=None, workers=None, chunks=None,
+                    block=1024, ddof=0):
+    """
+    `sum` / `mean` / `var` / `min` / `max` of a 2-D array along `axis`.
+
+    The other axis is split into chunks reduced on a thread pool (NumPy
+    releases the GIL inside the reductions). Float sums use
+    Kahan-compensated accumulation over blocks of `block` rows/columns.
+    """
+    if op not in ("sum", "mean", "var", "min", "max"):
+        raise ValueError(f"unsupported reduction: {op!r}")
+    if arr.ndim != 2:
+        raise ValueError("parallel_reduce expects a 2-D array")
+
+    keep = 1 - axis
+    # Same result dtypes as np.sum / np.mean: bool and small ints sum as the platform int
+    if op == "sum":
+        dtype = np.add.reduce(arr[:0], axis=axis).dtype
+    elif op in ("min", "max") or arr.dtype.kind == "f":
+        dtype = arr.dtype
+    else:
+        dtype = np.dtype(np.float64)
+    if out is None:
+        out = np.empty(arr.shape[keep], dtype=dtype)
+    elif out.shape != (arr.shape[keep],):
+        raise ValueError(f"out has shape {out.shape}, expected {(arr.shape[keep],)}")
+    elif not np.can_cast(dtype, out.dtype, casting="safe"):
+        raise TypeError(f"cannot store {op} result of dtype {dtype} in out of dtype {out.dtype}")
+    if np.issubdtype(arr.dtype, np.floating) or op in ("min", "max"):
+        src = arr
+    else:
+        src = arr.astype(np.float64) if op in ("mean", "var") else arr
+
+    if op == "mean" and arr.shape[axis] == 0:
+        warnings.warn("Mean of empty slice", RuntimeWarning, stacklevel=2)
+    elif op == "var" and arr.shape[axis] - ddof <= 0:
+        warnings.warn("Degrees of freedom <= 0 for slice", RuntimeWarning, stacklevel=2)
+
+    workers = workers or os.cpu_count() or 1
+    chunks = chunks or workers * 4
+    bounds = np.linspace(0, arr.shape[keep], chunks + 1).astype(np.int64)
+
+    def run(lo, hi):
+        part = src[lo:hi] if keep == 0 else src[:, lo:hi]
+        out[lo:hi] = _reduce_chunk(part, op, axis, block, ddof)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(run, bounds[:-1], bounds[1:]))
+    return out
+
+
+def parallel_reduce_demo():
+    print("Parallel Axis Reductions")
+
+    arr = np.array([[1, 2, 3], [4, 5, 6]], dtype=np.float32)
+    print("Sum by row (axis=1):", parallel_reduce(arr, "sum", axis=1))
+    print("Mean by column (axis=0):", parallel_reduce(arr, "mean", axis=0))
+    print("Var by column (axis=0):", parallel_reduce(arr, "var", axis=0))
+
+    out = np.empty(3, dtype=np.float32)
+    parallel_reduce(arr, "max", axis=0, out=out)
+    print("Max by column into out=:", out)
+    print("-" * 40)
+
+
+def reduction_benchmark(rows=200_000, cols=512, workers=None):
+    """
+    np.sum/np.mean vs parallel_reduce on float32, with error vs a float64 reference.
+    """
+    print(f"Reduction Benchmark ({rows:,} x {cols} float32)")
+
+    rng = np.random.default_rng(0)
+    arr = (rng.random((rows, cols), dtype=np.float32) * 1000).astype(np.float32)
+    reference = arr.sum(axis=0, dtype=np.float64)
+
+    for name, fn in [
+        ("np.sum axis=0", lambda: np.sum(arr, axis=0)),
+        ("parallel sum axis=0", lambda: parallel_reduce(arr, "sum", axis=0, workers=workers)),
+    ]:
+        start = time.perf_counter()
+        result = fn()
+        seconds = time.perf_counter() - start
+        error = np.max(np.abs(result - reference) / reference)
+        print(f"{name:<22} {seconds:8.3f}s   max rel. error {error:.2e}")
+
+    for name, fn in [
+        ("np.mean axis=1", lambda: np.mean(arr, axis=1)),
+        ("parallel mean axis=1", lambda: parallel_reduce(arr, "mean", axis=1, workers=workers)),
+    ]:
+        start = time.perf_counter()
+        fn()
+        print(f"{name:<22} {time.perf_counter() - start:8.3f}s")
+    print("-" * 40)
+
+
 # Stack, Split, Reshape
 def stacking_and_splitting():
     print("Stack & Split")
@@ -77,15 +649,129 @@ def stacking_and_splitting():
     print("-" * 40)
 
 
+# Growable Array: append rows without re-copying everything each time
+class GrowableArray:
+    """
+    Row buffer with amortized-doubling capacity.
+
+    Repeated `np.vstack` copies all existing rows on every append (O(n^2));
+    here each row is copied O(1) times on average. `view()` returns the
+    filled part without copying.
+    """
+
+    def __init__(self, row_shape=(), dtype=np.float64, capacity=16):
+        self._data = np.empty((max(capacity, 1),) + tuple(row_shape), dtype=dtype)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def capacity(self):
+        return len(self._data)
+
+    def _reserve(self, needed):
+        if needed <= self.capacity:
+            return
+        new_capacity = self.capacity
+        while new_capacity < needed:
+            new_capacity *= 2
+        grown = np.empty((new_capacity,) + self._data.shape[1:], dtype=self._data.dtype)
+        grown[:self._size] = self._data[:self._size]
+        self._data = grown
+
+    def append_rows(self, rows):
+        rows = np.asarray(rows, dtype=self._data.dtype)
+        if rows.shape == self._data.shape[1:]:
+            rows = rows[None]  # single row
+        self._reserve(self._size + len(rows))
+        self._data[self._size:self._size + len(rows)] = rows
+        self._size += len(rows)
+        return self
+
+    def view(self):
+        """Zero-copy view of the filled rows; invalidated by the next growth."""
+        return self._data[:self._size]
+
+
+def split_rows(arr, sections):
+    """
+    Like `np.vsplit`, but guaranteed to return views (basic slices only).
+
+    `sections` is a number of equal parts or a list of split indices.
+    """
+    try:
+        parts = operator.index(sections)   # int or NumPy integer
+    except TypeError:
+        bounds = [0] + list(sections) + [len(arr)]
+    else:
+        if parts <= 0:
+            raise ValueError("number sections must be larger than 0.")
+        if len(arr) % parts:
+            raise ValueError("array split does not result in an equal division")
+        step = len(arr) // parts
+        bounds = [i * step for i in range(parts + 1)]   # step may be 0 for an empty array
+    return [arr[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+
+def split_cols(arr, sections):
+    """Column version of `split_rows` (views, like `np.hsplit`)."""
+    return [part.T for part in split_rows(arr.T, sections)]
+
+
+def growable_array_demo():
+    print("Growable Array & View Splits")
+
+    buf = GrowableArray(row_shape=(3,), dtype=np.int64, capacity=2)
+    buf.append_rows([1, 2, 3])
+    buf.append_rows([[4, 5, 6], [7, 8, 9]])
+    print("Rows:\n", buf.view(), "| capacity:", buf.capacity)
+
+    matrix = buf.view()
+    top, bottom = split_rows(matrix, [1])
+    print("Split rows:", top, bottom)
+    print("Views, not copies:", np.shares_memory(top, matrix) and np.shares_memory(bottom, matrix))
+    print("Split cols:", split_cols(np.array([[1, 2], [3, 4]]), 2))
+    print("-" * 40)
+
+
+def stacking_benchmark(rows=10_000, width=16, batch=1):
+    """
+    Repeated `np.vstack` vs GrowableArray.append_rows.
+    """
+    print(f"Stacking Benchmark ({rows:,} rows x {width}, {batch} row(s) per append)")
+
+    chunk = np.ones((batch, width))
+
+    start = time.perf_counter()
+    stacked = np.empty((0, width))
+    for _ in range(rows // batch):
+        stacked = np.vstack([stacked, chunk])
+    vstack_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    buf = GrowableArray(row_shape=(width,))
+    for _ in range(rows // batch):
+        buf.append_rows(chunk)
+    grow_s = time.perf_counter() - start
+
+    print(f"repeated vstack: {vstack_s:.3f}s")
+    print(f"GrowableArray:   {grow_s:.3f}s  ({vstack_s / grow_s:.0f}x faster)")
+    print("Same result:", np.array_equal(stacked, buf.view()))
+    print("-" * 40)
+
+
 # Random Numbers for ML
 def random_numbers_demo():
     print("Random Sampling")
 
-    np.random.seed(42)
+    # A local Generator instead of np.random.seed(): no shared global state.
+    # See parallel_random.py for independent per-worker streams.
+    rng = np.random.default_rng(42)
 
-    print("Random integers:\n", np.random.randint(1, 100, size=(2, 3)))
-    print("Random floats:\n", np.random.rand(2, 3))
-    print("Normal dist:\n", np.random.normal(loc=0, scale=1, size=(2, 3)))
+    print("Random integers:\n", rng.integers(1, 100, size=(2, 3)))
+    print("Random floats:\n", rng.random((2, 3)))
+    print("Normal dist:\n", rng.normal(loc=0, scale=1, size=(2, 3)))
     print("-" * 40)
 
 
@@ -105,17 +791,96 @@ def performance_demo():
     print("-" * 40)
 
 
+# Out-of-core: square a memmap block by block, writing in place
+def square_memmap_inplace(path, dtype=np.float64, block_rows=1 << 20):
+    """
+    Square every element of a 1-D memmap file in place.
+
+    Each block is squared with `out=` into the mapped pages themselves, so no
+    temporary array is allocated and only one block is touched at a time.
+    """
+    data = np.memmap(path, dtype=dtype, mode="r+")
+    for start in range(0, len(data), block_rows):
+        block = data[start:start + block_rows]
+        np.square(block, out=block)
+    data.flush()
+    return len(data)
+
+
+def memmap_demo():
+    print("Memmap: square a file-backed array in blocks")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "data.bin")
+        np.arange(10, dtype=np.float64).tofile(path)
+        square_memmap_inplace(path, block_rows=4)
+        print("Squared on disk:", np.fromfile(path, dtype=np.float64))
+    print("-" * 40)
+
+
+def _time_best(fn, repeats=3):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def performance_benchmark(sizes=(10_000, 1_000_000, 10_000_000), loop_limit=1_000_000,
+                          block_rows=1 << 20):
+    """
+    Time vectorized, Python-loop and memmap-block squaring; report GB/s.
+
+    Throughput counts bytes read + bytes written. The loop is skipped above
+    `loop_limit` elements.
+    """
+    print("Performance Benchmark: square an array")
+    print(f"{'n':>12} {'variant':<12} {'seconds':>10} {'GB/s':>8}")
+
+    for n in sizes:
+        data = np.arange(n, dtype=np.float64)
+        moved = 2 * data.nbytes
+        out = np.empty_like(data)
+
+        timings = [
+            ("vectorized", _time_best(lambda: data ** 2)),
+            ("out=", _time_best(lambda: np.square(data, out=out))),
+        ]
+        if n <= loop_limit:
+            timings.append(("loop", _time_best(lambda: [x ** 2 for x in data], repeats=1)))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "data.bin")
+            data.tofile(path)
+            timings.append(("memmap", _time_best(
+                lambda: square_memmap_inplace(path, block_rows=block_rows), repeats=1)))
+            check = np.memmap(path, dtype=np.float64, mode="r")
+            assert np.array_equal(check[:5], data[:5] ** 2)
+            del check
+
+        for name, seconds in timings:
+            print(f"{n:>12,} {name:<12} {seconds:>10.4f} {moved / seconds / 1e9:>8.2f}")
+    print("-" * 40)
+
+
 def main():
     """
     Run all advanced NumPy features
     """
     slicing_and_indexing()
+    gather_scatter_demo()
     broadcasting_demo()
+    lazy_expression_demo()
     boolean_masking()
+    selection_demo()
     axis_operations()
+    parallel_reduce_demo()
     stacking_and_splitting()
+    growable_array_demo()
     random_numbers_demo()
     performance_demo()
+    memmap_demo()
 
 
 if __name__ == "__main__":
@@ -8,6 +8,12 @@ Why Use It?
 - Essential for ML (used in Pandas, Scikit-learn, TensorFlow, etc.)
 """
 
+import inspect
+import logging
+import math
+import time
+from contextlib import contextmanager
+
 import numpy as np
 
 # 1D and 2D Array Creation
@@ -39,6 +45,97 @@ def array_operations():
     print("-" * 40)
 
 
+# Batched Dot Products: one call for many pairs instead of a Python loop
+def batched_dot(a, b):
+    """
+    Row-wise dot products: out[i] = a[i] . b[i].
+
+    `b` may also be a single vector (d,), e.g. one query against many
+    embeddings; then this is a plain matrix-vector product.
+    """
+    a = np.asarray(a)
+    b = np.asarray(b)
+    if b.ndim == 1:
+        return a @ b
+    # (..., 1, d) @ (..., d, 1) -> (..., 1, 1): batched matmul over leading axes
+    return np.matmul(a[..., None, :], b[..., :, None])[..., 0, 0]
+
+
+def tiled_matmul(a, b, tile=512, out=None):
+    """
+    `a @ b` computed tile by tile so each step's operands fit in cache.
+
+    Useful when `a`/`b` are memmaps or otherwise too large to multiply in
+    one call; results accumulate into `out`.
+    """
+    n, k = a.shape
+    k2, m = b.shape
+    if k != k2:
+        raise ValueError(f"shapes {a.shape} and {b.shape} not aligned")
+    if out is None:
+        out = np.zeros((n, m), dtype=np.result_type(a, b))
+    else:
+        out[...] = 0
+
+    for i in range(0, n, tile):
+        for j in range(0, m, tile):
+            acc = out[i:i + tile, j:j + tile]
+            for p in range(0, k, tile):
+                acc += a[i:i + tile, p:p + tile] @ b[p:p + tile, j:j + tile]
+    return out
+
+
+def batched_dot_demo():
+    print("Batched Dot Products")
+
+    embeddings = np.array([[1.0, 0.0, 2.0], [0.5, 1.5, 0.0], [3.0, 1.0, 1.0]])
+    query = np.array([1.0, 2.0, 3.0])
+
+    print("Per-pair np.dot:", np.array([np.dot(e, query) for e in embeddings]))
+    print("Batched (query):", batched_dot(embeddings, query))
+    print("Batched (pairs):", batched_dot(embeddings, embeddings[::-1]))
+
+    a = np.arange(12.0).reshape(3, 4)
+    b = np.arange(8.0).reshape(4, 2)
+    print("Tiled matmul matches a @ b:", np.allclose(tiled_matmul(a, b, tile=2), a @ b))
+    print("-" * 40)
+
+
+def dot_benchmark(pairs=200_000, dim=64, size=2048, tile=512):
+    """
+    Per-pair `np.dot` loop vs. batched dot, and tiled vs. plain matmul.
+    """
+    print(f"Dot Benchmark ({pairs:,} pairs of dim {dim})")
+
+    rng = np.random.default_rng(0)
+    a = rng.random((pairs, dim))
+    b = rng.random((pairs, dim))
+    query = rng.random(dim)
+
+    def timed(fn):
+        start = time.perf_counter()
+        result = fn()
+        return time.perf_counter() - start, result
+
+    loop_s, expected = timed(lambda: np.array([np.dot(x, y) for x, y in zip(a, b)]))
+    batch_s, result = timed(lambda: batched_dot(a, b))
+    einsum_s, _ = timed(lambda: np.einsum("ij,ij->i", a, b))
+    query_s, _ = timed(lambda: batched_dot(a, query))
+    print(f"np.dot loop:        {loop_s:.4f}s")
+    print(f"batched (matmul):   {batch_s:.4f}s  ({loop_s / batch_s:.0f}x)")
+    print(f"batched (einsum):   {einsum_s:.4f}s  ({loop_s / einsum_s:.0f}x)")
+    print(f"one query vs all:   {query_s:.4f}s")
+    print("Match:", np.allclose(expected, result))
+
+    x = rng.random((size, size))
+    y = rng.random((size, size))
+    plain_s, expected = timed(lambda: x @ y)
+    tiled_s, result = timed(lambda: tiled_matmul(x, y, tile=tile))
+    print(f"matmul {size}x{size}:     {plain_s:.4f}s   tiled({tile}): {tiled_s:.4f}s  "
+          f"match: {np.allclose(expected, result)}")
+    print("-" * 40)
+
+
 # Array Indexing & Slicing
 def array_indexing():
     print("Indexing & Slicing")
@@ -77,6 +174,156 @@ def reshape_and_transform():
     print("-" * 40)
 
 
+# View-or-raise reshapes, plus a tracker that reports hidden copies
+log = logging.getLogger(__name__)
+
+_copy_events = None   # list while track_copies() is active
+_np_reshape = np.reshape  # unpatched, so the helpers don't double-report
+_np_ravel = np.ravel
+
+
+class CopyError(ValueError):
+    """Raised when a view was required but the operation would copy."""
+
+
+def _view_reshape(a, shape):
+    try:
+        return _np_reshape(a, shape, copy=False)
+    except TypeError:                      # NumPy < 2.1 has no copy= here
+        view = a.view()
+        try:
+            view.shape = shape
+        except AttributeError:
+            raise ValueError("Unable to avoid creating a copy while reshaping.")
+        return view
+
+
+def _resolve_shape(size, shape):
+    """`shape` as a tuple with any -1 filled in; ValueError if it can't hold `size` items."""
+    shape = (int(shape),) if np.ndim(shape) == 0 else tuple(int(d) for d in shape)
+    if shape.count(-1) > 1:
+        raise ValueError("can only specify one unknown dimension")
+    known = math.prod(d for d in shape if d != -1)
+    if -1 in shape and known and size % known == 0:
+        shape = tuple(size // known if d == -1 else d for d in shape)
+    if math.prod(shape) != size:
+        raise ValueError(f"cannot reshape array of size {size} into shape {shape}")
+    return shape
+
+
+def _record_copy(what, a, result):
+    if _copy_events is None:
+        return
+    frame = inspect.currentframe().f_back.f_back   # caller of the helper
+    code = frame.f_code
+    site = f"{code.co_filename}:{frame.f_lineno} in {code.co_name}"
+    _copy_events.append((what, result.nbytes, site))
+    log.warning("hidden copy: %s of %s %s (%d bytes) at %s",
+                what, a.shape, a.dtype, result.nbytes, site)
+
+
+def reshape(a, shape, require_view=False):
+    """
+    `a.reshape(shape)` that can insist on a view.
+
+    With `require_view=True` a copy raises `CopyError`; otherwise a copy is
+    allowed but reported while `track_copies()` is active.
+    """
+    try:
+        return _view_reshape(a, shape)
+    except ValueError:
+        if require_view:
+            _resolve_shape(a.size, shape)   # a size mismatch is not a copy problem
+            raise CopyError(f"reshape {a.shape} -> {shape} needs a copy "
+                            f"(strides {a.strides})") from None
+    result = _np_reshape(a, shape)
+    _record_copy("reshape", a, result)
+    return result
+
+
+def ravel(a, require_view=False):
+    """`a.ravel()` with the same view-or-raise / tracking rules as `reshape`."""
+    try:
+        return _view_reshape(a, -1)
+    except ValueError:
+        if require_view:
+            raise CopyError(f"ravel of {a.shape} with strides {a.strides} needs a copy") from None
+    result = _np_ravel(a)
+    _record_copy("ravel", a, result)
+    return result
+
+
+def flatten(a):
+    """`a.flatten()` always copies; go through here so the copy is tracked."""
+    result = a.flatten()
+    _record_copy("flatten", a, result)
+    return result
+
+
+def _tracked(name, func):
+    def wrapper(a, *args, **kwargs):
+        result = func(a, *args, **kwargs)
+        if isinstance(a, np.ndarray) and not np.shares_memory(result, a):
+            _record_copy(name, a, result)
+        return result
+    return wrapper
+
+
+@contextmanager
+def track_copies(patch_numpy=False):
+    """
+    Record every copy made by `reshape` / `ravel` / `flatten` in this block.
+
+    With `patch_numpy=True`, calls to `np.reshape` / `np.ravel` anywhere are
+    tracked too (ndarray methods such as `a.reshape` cannot be patched).
+    Yields a list of (operation, bytes, call site); each copy is also logged.
+    """
+    global _copy_events
+    previous, _copy_events = _copy_events, []
+    originals = {"reshape": _np_reshape, "ravel": _np_ravel}
+    if patch_numpy:
+        for name, func in originals.items():
+            setattr(np, name, _tracked(f"np.{name}", func))
+    try:
+        yield _copy_events
+    finally:
+        _copy_events = previous
+        if patch_numpy:
+            for name, func in originals.items():
+                setattr(np, name, func)
+
+
+def copy_hotspots(events):
+    """Total copied bytes per call site, largest first."""
+    totals = {}
+    for _, nbytes, site in events:
+        totals[site] = totals.get(site, 0) + nbytes
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+
+def zero_copy_demo():
+    print("Zero-Copy Reshape Planner")
+
+    a = np.array([[1, 2, 3], [4, 5, 6]])
+
+    print("ravel (view):", ravel(a, require_view=True))
+    print("reshape 3x2 (view):\n", reshape(a, (3, 2), require_view=True))
+    try:
+        ravel(a.T, require_view=True)
+    except CopyError as exc:
+        print("ravel of a.T refused:", exc)
+
+    with track_copies(patch_numpy=True) as events:
+        flatten(a)
+        ravel(a.T)
+        reshape(a.T, (6,))
+        np.ravel(a[:, ::2])      # plain NumPy call, caught by the patch
+    print("Copies seen:", [(what, nbytes) for what, nbytes, _ in events])
+    for site, nbytes in copy_hotspots(events):
+        print(f"  {nbytes} bytes at {site}")
+    print("-" * 40)
+
+
 # Real-World ML Example: Feature Normalization
 def normalize_features():
     print("ML Use Case: Feature Normalization")
@@ -93,16 +340,93 @@ def normalize_features():
     print("-" * 40)
 
 
+# Streaming Min-Max Scaler: fit on chunks, transform in place
+class MinMaxScaler:
+    """
+    Min-max scaling to [0, 1] that never needs the whole dataset at once.
+
+    `partial_fit` updates the running column min/max from one chunk of rows;
+    `transform` writes chunk by chunk into `out` (which may be the input
+    itself), so a memmap can be scaled without full-size temporaries.
+    Constant columns scale to 0 instead of dividing by zero.
+    """
+
+    def __init__(self, dtype=np.float64):
+        self.dtype = np.dtype(dtype)
+        self.data_min = None
+        self.data_max = None
+
+    def partial_fit(self, chunk):
+        chunk_min = chunk.min(axis=0).astype(self.dtype)
+        chunk_max = chunk.max(axis=0).astype(self.dtype)
+        if self.data_min is None:
+            self.data_min, self.data_max = chunk_min, chunk_max
+        else:
+            np.minimum(self.data_min, chunk_min, out=self.data_min)
+            np.maximum(self.data_max, chunk_max, out=self.data_max)
+        return self
+
+    def fit(self, X, chunk_rows=65_536):
+        for start in range(0, len(X), chunk_rows):
+            self.partial_fit(X[start:start + chunk_rows])
+        return self
+
+    @property
+    def data_range(self):
+        data_range = self.data_max - self.data_min
+        data_range[data_range == 0] = 1  # constant column -> (x - min) / 1 == 0
+        return data_range
+
+    def transform(self, X, out=None, chunk_rows=65_536):
+        if self.data_min is None:
+            raise ValueError("MinMaxScaler is not fitted yet; call fit/partial_fit first")
+        if out is None:
+            out = np.empty(X.shape, dtype=self.dtype)
+        # Divide rather than multiply by 1/range so the max maps to exactly 1.0
+        data_range = self.data_range
+        for start in range(0, len(X), chunk_rows):
+            block = out[start:start + chunk_rows]
+            np.subtract(X[start:start + chunk_rows], self.data_min, out=block,
+                        dtype=self.dtype, casting="same_kind")
+            np.divide(block, data_range, out=block)
+        return out
+
+    def fit_transform(self, X, out=None, chunk_rows=65_536):
+        return self.fit(X, chunk_rows).transform(X, out, chunk_rows)
+
+
+def streaming_scaler_demo():
+    print("Streaming Min-Max Scaler")
+
+    X = np.array([[100, 10, 5], [200, 20, 5], [300, 30, 5]])
+
+    scaler = MinMaxScaler(dtype=np.float32)
+    for chunk in (X[:2], X[2:]):          # rows arrive in chunks
+        scaler.partial_fit(chunk)
+
+    print("Min:", scaler.data_min, "Max:", scaler.data_max)
+    print("Normalized (float32, constant column -> 0):\n", scaler.transform(X, chunk_rows=2))
+
+    X_float = X.astype(np.float64)
+    scaler = MinMaxScaler().fit(X_float)
+    scaler.transform(X_float, out=X_float)  # in place, no extra copy
+    print("In-place:\n", X_float)
+    print("-" * 40)
+
+
 def main():
     """
     Run all NumPy demos
     """
     create_arrays()
     array_operations()
+    batched_dot_demo()
     array_indexing()
     create_helper_arrays()
     reshape_and_transform()
+    zero_copy_demo()
     normalize_features()
+    streaming_scaler_demo()
 
 
 if __name__ == "__main__":
@@ -1,15 +1,32 @@
 """
 Covers:
 - Merge / Join
+- Partitioned (parallel) merge
 - GroupBy + Aggregation
+- Streaming GroupBy over mini-batches
 - Pivot Table
+- Sparse pivot for mostly-empty tables
 - Query-based filtering
+- Compiled, cached query predicates
 - Datetime conversion + filtering
+- Day-bucketed datetime index
 - Chained condition filtering
+- Bitmap index filtering
 """
 
-import pandas as pd
+import ast
+import io
+import operator
+import os
+import time
+import tokenize
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+
+import numpy as np
+import pandas as pd
 
 # Merge / Join
 def merge_demo():
@@ -31,6 +48,136 @@ def merge_demo():
     print("-" * 40)
 
 
+# Partitioned Merge: hash both sides on the key, join partitions in a process pool
+_LEFT_POS = "__left_pos"
+_RIGHT_POS = "__right_pos"
+
+
+def _key_list(on):
+    return [on] if isinstance(on, str) else list(on)
+
+
+def _key_dtypes(left, right, on):
+    """
+    Common dtype for each key column whose dtype differs between the sides.
+
+    `hash_pandas_object` hashes by dtype (1 and 1.0 differ), while `pd.merge`
+    matches them, so both sides must be hashed as the same dtype.
+    """
+    dtypes = {}
+    for col in _key_list(on):
+        a, b = left[col].dtype, right[col].dtype
+        if a == b:
+            continue
+        if pd.api.types.is_numeric_dtype(a) and pd.api.types.is_numeric_dtype(b):
+            both_numpy = isinstance(a, np.dtype) and isinstance(b, np.dtype)
+            dtypes[col] = np.result_type(a, b) if both_numpy else pd.Float64Dtype()
+        else:
+            dtypes[col] = object   # object / str / category hash alike as values
+    return dtypes
+
+
+def hash_partition(df, on, partitions, dtypes=None):
+    """
+    Split `df` into `partitions` frames; equal keys always land in the same one.
+
+    Key columns are hashed as `dtypes` (column -> dtype) where given, so two
+    frames with differently typed keys can be partitioned consistently.
+    """
+    keys = df[_key_list(on)]
+    if dtypes:
+        keys = keys.astype(dtypes)
+    buckets = pd.util.hash_pandas_object(keys, index=False).to_numpy() % partitions
+    return [df[buckets == i] for i in range(partitions)]
+
+
+def _merge_partition(args):
+    left, right, on, how = args
+    return pd.merge(left, right, on=on, how=how)
+
+
+def _partition_jobs(left, right, on, how, partitions):
+    dtypes = _key_dtypes(left, right, on)
+    lefts = hash_partition(left, on, partitions, dtypes)
+    rights = hash_partition(right, on, partitions, dtypes)
+    for lp, rp in zip(lefts, rights):
+        if lp.empty and (how in ("inner", "left") or rp.empty):
+            continue
+        if rp.empty and how == "inner":
+            continue
+        yield lp, rp, on, how
+
+
+def iter_partitioned_merge(left, right, on, how="inner", partitions=None, workers=None):
+    """
+    Streaming mode: yield the joined partitions as soon as each one finishes.
+
+    Chunks arrive in completion order; concatenated they hold the same rows
+    as `pd.merge`, just not in the same order. At most `2 * workers`
+    partitions are submitted at a time, and each result is released once it
+    has been yielded, so only the chunks in flight are held in memory.
+    """
+    partitions = partitions or os.cpu_count() or 1
+    workers = workers or os.cpu_count() or 1
+    jobs = _partition_jobs(left, right, on, how, partitions)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(_merge_partition, job) for job in islice(jobs, 2 * workers)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            pending |= {pool.submit(_merge_partition, job) for job in islice(jobs, len(done))}
+            while done:
+                yield done.pop().result()
+
+
+def partitioned_merge(left, right, on, how="inner", partitions=None, workers=None):
+    """
+    Parallel equivalent of `pd.merge(left, right, on=on, how=how)`.
+
+    Supports inner / left / outer; row order and index match `pd.merge`.
+    """
+    if how not in ("inner", "left", "outer"):
+        raise ValueError(f"Unsupported join type: {how!r}")
+
+    # Remember original positions so the pandas row order can be restored
+    left = left.assign(**{_LEFT_POS: np.arange(len(left))})
+    right = right.assign(**{_RIGHT_POS: np.arange(len(right))})
+
+    chunks = list(iter_partitioned_merge(left, right, on, how, partitions, workers))
+    if not chunks:
+        chunks = [pd.merge(left.iloc[:0], right.iloc[:0], on=on, how=how)]
+    merged = pd.concat(chunks, ignore_index=True)
+
+    # outer joins sort on the key (as pd.merge does), inner/left keep left order
+    order = [*_key_list(on), _LEFT_POS, _RIGHT_POS] if how == "outer" else [_LEFT_POS, _RIGHT_POS]
+    merged = merged.sort_values(order, kind="stable", na_position="last")
+    return merged.drop(columns=[_LEFT_POS, _RIGHT_POS]).reset_index(drop=True)
+
+
+def partitioned_merge_demo():
+    print("Partitioned Merge (process pool)")
+
+    rng = np.random.default_rng(0)
+    users = pd.DataFrame({
+        "user_id": np.arange(1_000),
+        "name": [f"user{i}" for i in range(1_000)]
+    })
+    orders = pd.DataFrame({
+        "order_id": np.arange(20_000),
+        "user_id": rng.integers(0, 1_200, 20_000),
+        "amount": rng.integers(100, 1_000, 20_000)
+    })
+
+    for how in ("inner", "left", "outer"):
+        expected = pd.merge(users, orders, on="user_id", how=how)
+        result = partitioned_merge(users, orders, on="user_id", how=how, partitions=4)
+        print(f"{how:<6} rows={len(result):>6}  equals pd.merge: {result.equals(expected)}")
+
+    rows = sum(len(chunk) for chunk in
+               iter_partitioned_merge(users, orders, on="user_id", partitions=4))
+    print("Streamed inner rows:", rows)
+    print("-" * 40)
+
+
 # GroupBy + Multiple Aggregations
 def groupby_aggregation():
     print("GroupBy with Aggregation")
@@ -49,6 +196,93 @@ def groupby_aggregation():
     print("-" * 40)
 
 
+# Streaming GroupBy: fold mini-batches into per-key running stats
+class StreamingGroupBy:
+    """
+    Per-key sum / count / mean / min / max / variance over a stream of batches.
+
+    State is one row per key. Batches and partial states are combined with
+    Chan's parallel form of Welford's algorithm, so `result()` never rescans
+    history and states from several workers can be merged.
+    """
+
+    STATS = ["count", "sum", "mean", "m2", "min", "max"]
+
+    def __init__(self, key, value):
+        self.key = key
+        self.value = value
+        self.state = pd.DataFrame(columns=self.STATS, dtype="float64")
+
+    def update(self, batch):
+        grouped = batch.groupby(self.key)[self.value]
+        part = grouped.agg(["count", "sum", "mean", "min", "max"]).astype("float64")
+        deviation = batch[self.value] - grouped.transform("mean")
+        part["m2"] = (deviation ** 2).groupby(batch[self.key]).sum()
+        self._combine(part[self.STATS])
+        return self
+
+    def merge(self, other):
+        self._combine(other.state)
+        return self
+
+    def _combine(self, part):
+        if self.state.empty:
+            self.state = part.copy()
+            return
+        keys = self.state.index.union(part.index)
+        a = self.state.reindex(keys)
+        b = part.reindex(keys)
+        na = a["count"].fillna(0)
+        nb = b["count"].fillna(0)
+        n = na + nb
+        delta = b["mean"].fillna(0) - a["mean"].fillna(0)
+        weight = (nb / n).fillna(0)
+
+        combined = pd.DataFrame(index=keys)
+        combined["count"] = n
+        combined["sum"] = a["sum"].fillna(0) + b["sum"].fillna(0)
+        combined["mean"] = (a["mean"].fillna(0) + delta * weight).where(n > 0)
+        combined["m2"] = (a["m2"].fillna(0) + b["m2"].fillna(0)
+                          + delta ** 2 * (na * nb / n).fillna(0))
+        combined["min"] = pd.concat([a["min"], b["min"]], axis=1).min(axis=1)
+        combined["max"] = pd.concat([a["max"], b["max"]], axis=1).max(axis=1)
+        self.state = combined
+
+    def result(self):
+        st = self.state
+        return pd.DataFrame({
+            "total": st["sum"],
+            "avg": st["mean"],
+            "count": st["count"].astype("int64"),
+            "min": st["min"],
+            "max": st["max"],
+            "var": (st["m2"] / (st["count"] - 1)).where(st["count"] > 1),
+        }).rename_axis(self.key)
+
+
+def streaming_groupby_demo():
+    print("Streaming GroupBy (mini-batches)")
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "category": rng.choice(["A", "B", "C", "D"], 10_000),
+        "value": rng.normal(100, 15, 10_000)
+    })
+    batches = [df.iloc[i:i + 500] for i in range(0, len(df), 500)]
+
+    # Two workers each see half the stream, then merge their states
+    worker1 = StreamingGroupBy("category", "value")
+    worker2 = StreamingGroupBy("category", "value")
+    for i, batch in enumerate(batches):
+        (worker1 if i % 2 == 0 else worker2).update(batch)
+    result = worker1.merge(worker2).result()
+    print(result)
+
+    expected = df.groupby("category")["value"].agg(["sum", "mean", "count", "min", "max", "var"])
+    print("Matches full groupby:", np.allclose(result.to_numpy(), expected.to_numpy()))
+    print("-" * 40)
+
+
 # Pivot Table
 def pivot_table_demo():
     print("Pivot Table")
@@ -64,6 +298,97 @@ def pivot_table_demo():
     print("-" * 40)
 
 
+# Sparse Pivot: category-code both axes, sum only the non-empty cells
+class SparsePivot:
+    """
+    Sum-pivot stored as CSR-ordered COO triplets plus the axis labels.
+
+    Only non-empty cells are kept; `to_dense()` is the explicit opt-in for
+    the full index x columns DataFrame.
+    """
+
+    def __init__(self, index, columns, rows, cols, data):
+        self.index = index
+        self.columns = columns
+        self.rows = rows
+        self.cols = cols
+        self.data = data
+
+    @property
+    def shape(self):
+        return len(self.index), len(self.columns)
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    @property
+    def indptr(self):
+        """CSR row pointer: row i owns data[indptr[i]:indptr[i + 1]]."""
+        counts = np.bincount(self.rows, minlength=len(self.index))
+        return np.concatenate([[0], np.cumsum(counts)])
+
+    def to_series(self):
+        """Long format: one value per non-empty (index, column) pair."""
+        mi = pd.MultiIndex.from_arrays([self.index[self.rows], self.columns[self.cols]])
+        return pd.Series(self.data, index=mi)
+
+    def to_scipy(self):
+        from scipy import sparse  # optional: pip install scipy
+        return sparse.csr_matrix((self.data, self.cols, self.indptr), shape=self.shape)
+
+    def to_dense(self, fill_value=0):
+        dense = np.full(self.shape, fill_value, dtype=self.data.dtype)
+        dense[self.rows, self.cols] = self.data
+        return pd.DataFrame(dense, index=self.index, columns=self.columns)
+
+
+def sparse_pivot_table(df, index, columns, values):
+    """
+    Memory-light `pd.pivot_table(..., aggfunc="sum", fill_value=0)`.
+
+    Memory is proportional to the number of non-empty cells, not to
+    len(index) x len(columns).
+    """
+    row_codes, row_labels = pd.factorize(df[index], sort=True)
+    col_codes, col_labels = pd.factorize(df[columns], sort=True)
+    vals = df[values].to_numpy()
+
+    keep = (row_codes >= 0) & (col_codes >= 0) & ~pd.isna(vals)
+    row_codes, col_codes, vals = row_codes[keep], col_codes[keep], vals[keep]
+
+    # One int64 id per cell; unique() sorts them, which is row-major (CSR) order
+    cell = row_codes.astype(np.int64) * len(col_labels) + col_codes
+    cells, inverse = np.unique(cell, return_inverse=True)
+    sums = np.bincount(inverse, weights=vals, minlength=len(cells))
+    if np.issubdtype(vals.dtype, np.integer):
+        sums = sums.astype(vals.dtype)
+
+    row_labels = pd.Index(row_labels, name=index)
+    col_labels = pd.Index(col_labels, name=columns)
+    return SparsePivot(row_labels, col_labels,
+                       cells // len(col_labels), cells % len(col_labels), sums)
+
+
+def sparse_pivot_demo():
+    print("Sparse Pivot Table")
+
+    sales = pd.DataFrame({
+        "region": ["West", "West", "East", "East", "South", "West"],
+        "product": ["A", "B", "A", "B", "A", "A"],
+        "amount": [100, 200, 150, 250, 300, 50]
+    })
+
+    pivot = sparse_pivot_table(sales, index="region", columns="product", values="amount")
+    print("Shape:", pivot.shape, "| stored cells:", pivot.nnz)
+    print("Non-empty cells:\n", pivot.to_series())
+
+    expected = pd.pivot_table(sales, index="region", columns="product",
+                              values="amount", aggfunc="sum", fill_value=0)
+    print("Dense matches pivot_table:", pivot.to_dense().equals(expected))
+    print("-" * 40)
+
+
 # Query-based Filtering
 def query_filter_demo():
     print("Filtering with query()")
@@ -79,6 +404,165 @@ def query_filter_demo():
     print("-" * 40)
 
 
+# Compiled Queries: parse an expression once, reuse it on every new frame
+_COMPARE_OPS = {
+    ast.Eq: operator.eq, ast.NotEq: operator.ne,
+    ast.Lt: operator.lt, ast.LtE: operator.le,
+    ast.Gt: operator.gt, ast.GtE: operator.ge,
+}
+_BIN_OPS = {
+    ast.Add: operator.add, ast.Sub: operator.sub,
+    ast.Mult: operator.mul, ast.Div: operator.truediv,
+    ast.Mod: operator.mod, ast.Pow: operator.pow,
+}
+
+
+def _compile_node(node, columns):
+    """
+    Turn one AST node into a function `df -> numpy array (or scalar)`.
+    """
+    if isinstance(node, ast.Expression):
+        return _compile_node(node.body, columns)
+
+    if isinstance(node, ast.Name):
+        if node.id not in columns:
+            raise NameError(f"name {node.id!r} is not a column")
+        name = node.id
+        return lambda df: df[name].to_numpy()
+
+    if isinstance(node, ast.Constant):
+        value = node.value
+        return lambda df: value
+
+    if isinstance(node, (ast.List, ast.Tuple)):
+        items = [ast.literal_eval(elt) for elt in node.elts]
+        return lambda df: items
+
+    if isinstance(node, ast.BoolOp):
+        parts = [_compile_node(v, columns) for v in node.values]
+        combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+        return lambda df: combine.reduce([p(df) for p in parts])
+
+    if isinstance(node, ast.UnaryOp):
+        operand = _compile_node(node.operand, columns)
+        if isinstance(node.op, (ast.Not, ast.Invert)):
+            return lambda df: np.logical_not(operand(df))
+        if isinstance(node.op, ast.USub):
+            return lambda df: -operand(df)
+
+    if isinstance(node, ast.BinOp) and type(node.op) in _BIN_OPS:
+        op = _BIN_OPS[type(node.op)]
+        left = _compile_node(node.left, columns)
+        right = _compile_node(node.right, columns)
+        return lambda df: op(left(df), right(df))
+
+    if isinstance(node, ast.Compare):
+        operands = [_compile_node(n, columns) for n in [node.left] + node.comparators]
+        steps = []
+        for i, op in enumerate(node.ops):
+            if isinstance(op, (ast.In, ast.NotIn)):
+                negate = isinstance(op, ast.NotIn)
+                steps.append((i, lambda a, b, negate=negate: np.isin(a, b, invert=negate)))
+            elif type(op) in _COMPARE_OPS:
+                steps.append((i, _COMPARE_OPS[type(op)]))
+            else:
+                break
+        else:
+            def compare(df):
+                values = [o(df) for o in operands]
+                # a < b < c  ->  (a < b) & (b < c)
+                return np.logical_and.reduce([fn(values[i], values[i + 1]) for i, fn in steps])
+            return compare
+
+    raise SyntaxError(f"unsupported query syntax: {ast.dump(node)}")
+
+
+def _rewrite_booleans(expr):
+    """
+    Like pandas, treat `&` / `|` as `and` / `or` so they bind looser than `==`.
+    """
+    tokens = []
+    for tok in tokenize.generate_tokens(io.StringIO(expr.strip()).readline):
+        if tok.type == tokenize.OP and tok.string in ("&", "|"):
+            tok = tok._replace(string=" and " if tok.string == "&" else " or ")
+        tokens.append((tok.type, tok.string))
+    return tokenize.untokenize(tokens)
+
+
+@lru_cache(maxsize=128)
+def _compile_cached(expr, schema):
+    tree = ast.parse(_rewrite_booleans(expr), mode="eval")
+    return _compile_node(tree, {name for name, _ in schema})
+
+
+def compile_query(expr, df):
+    """
+    Compiled predicate for `expr`, cached by (expression text, schema).
+
+    The predicate maps a DataFrame with that schema to a boolean mask.
+    """
+    schema = tuple((col, str(dtype)) for col, dtype in df.dtypes.items())
+    return _compile_cached(expr, schema)
+
+
+def fast_query(df, expr):
+    """
+    Drop-in for `df.query(expr)` on the supported subset of the syntax.
+    """
+    return df[compile_query(expr, df)(df)]
+
+
+def query_cache_stats():
+    return _compile_cached.cache_info()
+
+
+def compiled_query_demo():
+    print("Compiled & cached query()")
+
+    expr = "age > 28 and city != 'Mumbai'"
+    for ages in ([25, 32, 29], [40, 22, 31]):
+        df = pd.DataFrame({
+            "name": ["Alice", "Bob", "Charlie"],
+            "age": ages,
+            "city": ["Pune", "Mumbai", "Delhi"]
+        })
+        result = fast_query(df, expr)
+        print("Filtered:\n", result)
+        print("Same as df.query:", result.equals(df.query(expr)))
+    print("Cache:", query_cache_stats())
+    print("-" * 40)
+
+
+def query_benchmark(n=1_000, repeats=2_000):
+    """
+    Time `df.query` against the cached compiled predicate on fresh frames.
+    """
+    print(f"Query Benchmark ({repeats} calls, {n} rows each)")
+
+    rng = np.random.default_rng(0)
+    cities = np.array(["Pune", "Mumbai", "Delhi", "Chennai"])
+    frames = [pd.DataFrame({
+        "age": rng.integers(18, 60, n),
+        "city": cities[rng.integers(0, len(cities), n)]
+    }) for _ in range(8)]
+    expr = "age > 28 and city != 'Mumbai'"
+
+    start = time.perf_counter()
+    for i in range(repeats):
+        frames[i % len(frames)].query(expr)
+    plain = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(repeats):
+        fast_query(frames[i % len(frames)], expr)
+    compiled = time.perf_counter() - start
+
+    print(f"df.query:  {plain:.3f}s")
+    print(f"compiled:  {compiled:.3f}s  ({plain / compiled:.1f}x faster)")
+    print("Cache:", query_cache_stats())
+    print("-" * 40)
+
+
 # Date Handling & Filtering
 def datetime_handling():
     print("Datetime Handling")
@@ -96,6 +580,119 @@ def datetime_handling():
     print("-" * 40)
 
 
+# Time-partitioned index: sort once, then a date range is a searchsorted slice
+def parse_timestamps(values, fmt="ISO8601"):
+    """
+    Parse fixed-format timestamps; an explicit format skips per-row inference.
+
+    "ISO8601" uses pandas' dedicated ISO parser; pass a strftime pattern
+    (e.g. "%d/%m/%Y %H:%M") for other layouts.
+    """
+    return pd.to_datetime(values, format=fmt, cache=False)
+
+
+class DayIndex:
+    """
+    Sorted timestamps bucketed by calendar day.
+
+    `positions(start, end)` is two binary searches instead of a full scan,
+    and `day(date)` reads the bucket bounds directly. Tz-aware timestamps
+    are bucketed by local wall-clock time, matching `dt.date`.
+    """
+
+    def __init__(self, timestamps):
+        stamps = pd.DatetimeIndex(timestamps)
+        self.tz = stamps.tz
+        values = stamps.tz_localize(None).as_unit("ns").to_numpy()   # local wall time
+        self.order = np.argsort(values, kind="stable")
+        self.sorted = values[self.order]
+        self.days, starts = np.unique(self.sorted.astype("datetime64[D]"), return_index=True)
+        self.bounds = np.append(starts, len(self.sorted))
+
+    def _rows(self, lo, hi):
+        # Back to original row order so results line up with a boolean filter
+        return np.sort(self.order[lo:hi])
+
+    def positions(self, start, end):
+        """
+        Row positions with start <= timestamp < end.
+
+        Naive bounds are wall-clock times in the index's time zone;
+        tz-aware bounds are converted to it first.
+        """
+        bounds = np.array([self._wall(start), self._wall(end)], dtype="datetime64[ns]")
+        lo, hi = np.searchsorted(self.sorted, bounds)
+        return self._rows(lo, hi)
+
+    def _wall(self, ts):
+        ts = pd.Timestamp(ts)
+        if ts.tz is not None:
+            ts = ts.tz_convert(self.tz).tz_localize(None)
+        return ts.as_unit("ns").to_datetime64()
+
+    def day(self, date):
+        """Row positions whose timestamp falls on `date`."""
+        i = np.searchsorted(self.days, np.datetime64(date, "D"))
+        if i == len(self.days) or self.days[i] != np.datetime64(date, "D"):
+            return np.empty(0, dtype=np.intp)
+        return self._rows(self.bounds[i], self.bounds[i + 1])
+
+
+def day_index_demo():
+    print("Fast datetime parsing + day index")
+
+    df = pd.DataFrame({
+        "event": ["Login", "Logout", "Payment", "Error"],
+        "timestamp": ["2024-01-01 08:00", "2024-01-01 09:30", "2024-01-02 12:00", "2024-01-02 15:45"]
+    })
+
+    df["timestamp"] = parse_timestamps(df["timestamp"])
+    index = DayIndex(df["timestamp"])
+
+    print("Filtered (2024-01-01):\n", df.iloc[index.day(datetime(2024, 1, 1).date())])
+    print("Range 2024-01-01 09:00 to 2024-01-02 13:00:\n",
+          df.iloc[index.positions(datetime(2024, 1, 1, 9), datetime(2024, 1, 2, 13))])
+    print("-" * 40)
+
+
+def datetime_benchmark(n=5_000_000):
+    """
+    `dt.date == date` scan vs. inferred/known-format parsing and the day index.
+    """
+    print(f"Datetime Benchmark ({n:,} rows)")
+
+    rng = np.random.default_rng(0)
+    base = np.datetime64("2024-01-01T00:00", "m")
+    minutes = rng.integers(0, 60 * 24 * 90, n)
+    raw = pd.Series(np.datetime_as_string(base + minutes, unit="m")).str.replace("T", " ")
+
+    start = time.perf_counter()
+    parsed = pd.to_datetime(raw)
+    print(f"to_datetime (inferred):   {time.perf_counter() - start:.3f}s")
+    start = time.perf_counter()
+    parsed = parse_timestamps(raw)
+    print(f"to_datetime (ISO8601):    {time.perf_counter() - start:.3f}s")
+
+    target = datetime(2024, 2, 1).date()
+    start = time.perf_counter()
+    scan = np.flatnonzero(parsed.dt.date == target)
+    scan_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = DayIndex(parsed)
+    build_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    hits = index.day(target)
+    lookup_s = time.perf_counter() - start
+
+    print(f"dt.date == date scan:     {scan_s:.3f}s")
+    print(f"DayIndex build (once):    {build_s:.3f}s")
+    print(f"DayIndex lookup:          {lookup_s:.5f}s  ({scan_s / lookup_s:.0f}x faster)")
+    print("Same rows:", np.array_equal(scan, hits))
+    print("-" * 40)
+
+
 # Chained Filtering with & and |
 def chained_filtering():
     print("Chained Filtering with & and |")
@@ -111,16 +708,250 @@ def chained_filtering():
     print("-" * 40)
 
 
+# Bitmap Index: packed bits per value / per range bin, combined with bitwise ops
+_OPS = {">": operator.gt, ">=": operator.ge, "<": operator.lt,
+        "<=": operator.le, "==": operator.eq, "!=": operator.ne}
+
+
+def _reserve(buf, size):
+    """
+    Return `buf`, or a copy with at least double the capacity if it holds
+    fewer than `size` items. Growing geometrically keeps appends amortized O(1).
+    """
+    if size <= len(buf):
+        return buf
+    grown = np.zeros(max(size, 2 * len(buf)), dtype=buf.dtype)
+    grown[: len(buf)] = buf
+    return grown
+
+
+def _append_bits(buf, n, mask):
+    """
+    Write boolean `mask` after the first `n` bits of packbits buffer `buf`.
+
+    Only the partial tail byte and the new bytes are touched; returns the
+    (possibly regrown) buffer.
+    """
+    buf = _reserve(buf, (n + len(mask) + 7) // 8)
+    start, tail = divmod(n, 8)
+    if tail:
+        head = np.unpackbits(buf[start:start + 1], count=tail).astype(bool)
+        mask = np.concatenate([head, mask])
+    packed = np.packbits(mask)
+    buf[start:start + len(packed)] = packed
+    return buf
+
+
+class Bitmap:
+    """
+    A row set stored as packed bits (1 bit per row).
+    """
+
+    def __init__(self, bits, n):
+        self.bits = bits
+        self.n = n
+
+    @classmethod
+    def zeros(cls, n):
+        return cls(np.zeros((n + 7) // 8, dtype=np.uint8), n)
+
+    def __and__(self, other):
+        return Bitmap(self.bits & other.bits, self.n)
+
+    def __or__(self, other):
+        return Bitmap(self.bits | other.bits, self.n)
+
+    def __invert__(self):
+        bits = ~self.bits
+        if self.n % 8:
+            bits[-1] &= np.uint8(0xFF << (8 - self.n % 8) & 0xFF)  # clear padding
+        return Bitmap(bits, self.n)
+
+    @property
+    def nbytes(self):
+        return self.bits.nbytes
+
+    def positions(self):
+        return np.flatnonzero(np.unpackbits(self.bits, count=self.n))
+
+
+class BitmapIndex:
+    """
+    Bitmaps for low-cardinality / boolean columns and range-binned numerics.
+
+    Build once, `append()` new rows, then combine conditions with `&`, `|`,
+    `~` on packed bits and take `.positions()` of the final result only.
+    """
+
+    def __init__(self, df, categorical=(), numeric=(), bins=16):
+        self.n = 0
+        self.maps = {col: {} for col in list(categorical) + list(numeric)}
+        self.edges = {}
+        self.bin_range = {col: {} for col in numeric}
+        self.values = {col: np.empty(0, dtype=df[col].dtype) for col in numeric}
+        for col in numeric:
+            # Equal-population bins from the first load; later rows reuse them
+            qs = np.nanquantile(df[col].to_numpy(), np.linspace(0, 1, bins + 1)[1:-1])
+            self.edges[col] = np.unique(qs)
+        self.append(df)
+
+    def _add(self, col, keys):
+        # factorize handles None/NaN (code -1); missing rows get their own bitmap under None
+        codes, uniques = pd.factorize(keys)
+        present = dict(zip(uniques.tolist(), range(len(uniques))))
+        if (codes == -1).any():
+            present[None] = -1
+        maps = self.maps[col]
+        for key in set(maps) | set(present):
+            packed = maps.get(key, Bitmap.zeros(self.n).bits)
+            mask = codes == present[key] if key in present else np.zeros(len(codes), dtype=bool)
+            maps[key] = _append_bits(packed, self.n, mask)
+
+    def append(self, df):
+        for col in self.maps:
+            values = df[col].to_numpy()
+            if col in self.edges:
+                missing = pd.isna(values)
+                codes = np.searchsorted(self.edges[col], values, side="right")
+                for code in np.unique(codes[~missing]).tolist():
+                    in_bin = values[(codes == code) & ~missing]
+                    lo, hi = self.bin_range[col].get(code, (in_bin.min(), in_bin.max()))
+                    self.bin_range[col][code] = (min(lo, in_bin.min()), max(hi, in_bin.max()))
+                buf = _reserve(self.values[col], self.n + len(values))
+                buf[self.n:self.n + len(values)] = values
+                self.values[col] = buf
+                self._add(col, pd.arrays.IntegerArray(codes.astype(np.int64), missing))
+            else:
+                self._add(col, values)
+        self.n += len(df)
+        return self
+
+    def bitmap(self, col, key):
+        if key not in self.maps[col]:
+            return Bitmap.zeros(self.n)
+        # Buffers carry spare capacity; expose only the bytes in use
+        return Bitmap(self.maps[col][key][: (self.n + 7) // 8], self.n)
+
+    def eq(self, col, value):
+        return self.where(col, "==", value)
+
+    def isna(self, col):
+        return self.bitmap(col, None)
+
+    def where(self, col, op, value):
+        """
+        Rows where `col <op> value`. Missing values only match "!=", as in
+        pandas comparisons.
+        """
+        fn = _OPS[op]
+        result = self.isna(col) if op == "!=" else Bitmap.zeros(self.n)
+        if col not in self.edges:
+            for key in self.maps[col]:
+                if key is not None and fn(key, value):
+                    result = result | self.bitmap(col, key)
+            return result
+
+        for code, (lo, hi) in self.bin_range[col].items():
+            if op in ("==", "!="):
+                full = lo == hi == value
+                empty = value < lo or value > hi
+                if op == "!=":
+                    full, empty = empty, full
+            else:
+                full = fn(lo, value) and fn(hi, value)
+                empty = not fn(lo, value) and not fn(hi, value)
+            if empty:
+                continue
+            bin_map = self.bitmap(col, code)
+            if full:
+                result = result | bin_map
+            else:
+                # Boundary bin: check actual values for just these rows
+                rows = bin_map.positions()
+                rows = rows[fn(self.values[col][rows], value)]
+                bits = result.bits.copy()
+                np.bitwise_or.at(bits, rows >> 3, (0x80 >> (rows & 7)).astype(np.uint8))
+                result = Bitmap(bits, self.n)
+        return result
+
+    @property
+    def nbytes(self):
+        bitmaps = sum(bits.nbytes for maps in self.maps.values() for bits in maps.values())
+        return bitmaps + sum(values.nbytes for values in self.values.values())
+
+
+def bitmap_filter_demo():
+    print("Bitmap Index Filtering")
+
+    df = pd.DataFrame({
+        "name": ["Alice", "Bob", "Charlie", "David"],
+        "score": [85, 67, 92, 40],
+        "passed": [True, True, True, False]
+    })
+
+    index = BitmapIndex(df, categorical=["passed"], numeric=["score"], bins=2)
+    hits = index.where("score", ">", 70) & index.eq("passed", True)
+    print("Passed and scored > 70:\n", df.iloc[hits.positions()])
+
+    new_rows = pd.DataFrame({"name": ["Eve"], "score": [88], "passed": [True]})
+    df = pd.concat([df, new_rows], ignore_index=True)
+    index.append(new_rows)
+    hits = index.where("score", ">", 70) & index.eq("passed", True)
+    print("After append:\n", df.iloc[hits.positions()])
+    print("-" * 40)
+
+
+def bitmap_benchmark(n=5_000_000, repeats=20):
+    """
+    Boolean-mask chained filter vs. the bitmap index: time and memory.
+    """
+    print(f"Bitmap Benchmark ({n:,} rows)")
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "score": rng.integers(0, 101, n),
+        "passed": rng.random(n) < 0.7,
+        "grade": rng.choice(["A", "B", "C", "D"], n)
+    })
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        mask_rows = np.flatnonzero((df["score"] > 70) & (df["passed"]) | (df["grade"] == "A"))
+    mask_s = (time.perf_counter() - start) / repeats
+
+    start = time.perf_counter()
+    index = BitmapIndex(df, categorical=["passed", "grade"], numeric=["score"])
+    build_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        hits = (index.where("score", ">", 70) & index.eq("passed", True)) | index.eq("grade", "A")
+        bitmap_rows = hits.positions()
+    bitmap_s = (time.perf_counter() - start) / repeats
+
+    print(f"Boolean masks:   {mask_s * 1e3:8.2f} ms/query, ~{3 * n / 1e6:.1f} MB of masks per query")
+    print(f"Bitmap index:    {bitmap_s * 1e3:8.2f} ms/query, {index.nbytes / 1e6:.1f} MB index "
+          f"(built once in {build_s:.2f}s), {n / 8 / 1e6:.1f} MB per intermediate")
+    print("Same rows:", np.array_equal(mask_rows, bitmap_rows))
+    print("-" * 40)
+
+
 def main():
     """
     Run all advanced pandas features
     """
     merge_demo()
+    partitioned_merge_demo()
     groupby_aggregation()
+    streaming_groupby_demo()
     pivot_table_demo()
+    sparse_pivot_demo()
     query_filter_demo()
+    compiled_query_demo()
     datetime_handling()
+    day_index_demo()
     chained_filtering()
+    bitmap_filter_demo()
 
 
 if __name__ == "__main__":
@@ -4,8 +4,23 @@ Why Pandas?
 - Ideal for data analysis, CSV/Excel I/O, APIs, transformations
 """
 
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
 import pandas as pd
 
+# Optional: Parquet I/O and Arrow-backed strings
+# Run: pip install pyarrow
+try:
+    import pyarrow  # noqa: F401  (pandas picks it up as the parquet engine)
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+
 # Create Series and DataFrame
 def create_basics():
     print("Create Series and DataFrame")
@@ -25,6 +40,75 @@ def create_basics():
     return df
 
 
+# Compact Columns: narrow numeric dtypes, category / Arrow strings
+def compact_column(s, category_ratio=0.5, float32=False, arrow_strings=False):
+    """
+    Smallest sensible dtype for one column.
+
+    - ints -> narrowest signed/unsigned int that holds the range
+    - floats -> float32 only when `float32=True` (it loses precision)
+    - strings -> `category` when unique values are at most `category_ratio`
+      of the rows, else Arrow-backed strings if requested and available
+    """
+    if pd.api.types.is_bool_dtype(s):
+        return s
+    if pd.api.types.is_integer_dtype(s):
+        downcast = "unsigned" if len(s) and s.min() >= 0 else "integer"
+        return pd.to_numeric(s, downcast=downcast)
+    if pd.api.types.is_float_dtype(s):
+        return pd.to_numeric(s, downcast="float") if float32 else s
+    if pd.api.types.is_object_dtype(s) or pd.api.types.is_string_dtype(s):
+        if len(s) and s.nunique(dropna=False) <= category_ratio * len(s):
+            return s.astype("category")
+        if arrow_strings and HAS_PYARROW:
+            return s.astype("string[pyarrow]")
+    return s
+
+
+def compact_frame(data, schema=None, **options):
+    """
+    Build a DataFrame with compact dtypes.
+
+    `schema` maps column -> dtype for columns you want to pin explicitly;
+    every other column goes through `compact_column(**options)`.
+    """
+    df = pd.DataFrame(data)
+    schema = schema or {}
+    return pd.DataFrame({
+        col: df[col].astype(schema[col]) if col in schema else compact_column(df[col], **options)
+        for col in df.columns
+    })
+
+
+def memory_report(before, after):
+    b = before.memory_usage(deep=True)
+    a = after.memory_usage(deep=True)
+    report = pd.DataFrame({
+        "dtype_before": before.dtypes.astype(str),
+        "dtype_after": after.dtypes.astype(str),
+        "bytes_before": b.drop("Index"),
+        "bytes_after": a.drop("Index"),
+    })
+    print(report)
+    print(f"Total: {b.sum():,} -> {a.sum():,} bytes ({b.sum() / a.sum():.1f}x smaller)")
+
+
+def compact_create_demo(n=100_000):
+    print("Compact DataFrame (typed columns)")
+
+    rng = np.random.default_rng(0)
+    data = {
+        "name": [f"user{i}" for i in range(n)],
+        "age": rng.integers(18, 90, n),
+        "city": rng.choice(["Pune", "Mumbai", "Delhi"], n).astype(object)
+    }
+
+    before = pd.DataFrame(data)
+    after = compact_frame(data, arrow_strings=True)
+    memory_report(before, after)
+    print("-" * 40)
+
+
 # Indexing, Filtering, Sorting
 def indexing_filtering(df):
     print("Indexing & Filtering")
@@ -36,6 +120,161 @@ def indexing_filtering(df):
     print("-" * 40)
 
 
+# Sorted-Index Cache: argsort once, then range filters / sorts are slices
+def _descending(order, sorted_values):
+    """
+    Stable descending order from a stable ascending `order` (no NaNs).
+
+    Plain `order[::-1]` would also reverse rows with equal keys; instead the
+    runs of equal keys are reversed as whole runs, keeping each run's order.
+    """
+    n = len(order)
+    if n == 0:
+        return order
+    starts = np.flatnonzero(np.concatenate([[True], sorted_values[1:] != sorted_values[:-1]]))
+    lengths = np.diff(np.append(starts, n))
+    starts, lengths = starts[::-1], lengths[::-1]
+    offsets = np.arange(n) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return order[np.repeat(starts, lengths) + offsets]
+
+
+def _same_data(cached, current):
+    """True if two column arrays are the same storage (not just equal values)."""
+    if cached is current:
+        # Extension arrays (str, category, Int64, ...) come back as the same object
+        return True
+    if type(cached) is not type(current) or len(cached) != len(current):
+        return False
+    if isinstance(current, (pd.arrays.DatetimeArray, pd.arrays.TimedeltaArray)):
+        return np.shares_memory(cached.asi8, current.asi8)
+    if isinstance(current, pd.arrays.NumpyExtensionArray):
+        return np.shares_memory(cached.to_numpy(), current.to_numpy())
+    return False
+
+
+class SortedIndex:
+    """
+    Per-column argsort permutations cached for one DataFrame.
+
+    A range filter becomes two `searchsorted` calls and a slice of the
+    permutation; a repeat sort is a `take`. Entries are rebuilt when the
+    column's data changes: with copy-on-write (pandas >= 3) any write to the
+    frame gives it a new buffer, which the cache notices. Call
+    `invalidate()` after in-place edits on older pandas.
+    """
+
+    def __init__(self, df):
+        self.df = df
+        self._cache = {}
+
+    def invalidate(self, col=None):
+        if col is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(col, None)
+
+    def _fresh(self, col):
+        """Cached entry for `col` if the column still has the same data, else None."""
+        entry = self._cache.get(col)
+        if entry is None:
+            return None
+        return entry if _same_data(entry[0].array, self.df[col].array) else None
+
+    def _entry(self, col):
+        entry = self._fresh(col)
+        if entry is None:
+            # Keeping the Series (not just its array) registers a reference,
+            # so copy-on-write gives the frame a new buffer on the next write
+            column = self.df[col]
+            values = column.to_numpy()
+            # Sort only non-null values (None/NaN don't compare with str);
+            # missing rows go last in their original order, as in sort_values
+            null = pd.isna(values)
+            valid = np.flatnonzero(~null)
+            order = valid[np.argsort(values[valid], kind="stable")]
+            entry = (column, np.concatenate([order, np.flatnonzero(null)]), values[order])
+            self._cache[col] = entry
+        return entry
+
+    def sort(self, col, ascending=True):
+        """Same rows as `df.sort_values(col, ascending=...)` (stable), from the cached order."""
+        _, order, sorted_values = self._entry(col)
+        if not ascending:
+            valid = len(sorted_values)   # NaN rows stay last, as in sort_values
+            order = np.concatenate([_descending(order[:valid], sorted_values), order[valid:]])
+        return self.df.take(order)
+
+    def between(self, col, lower=None, upper=None, inclusive="both"):
+        """
+        Rows with lower <= col <= upper (bounds optional), in original order.
+
+        `inclusive` is "both", "neither", "left" or "right", as in `Series.between`.
+        """
+        _, order, sorted_values = self._entry(col)
+        lo, hi = 0, len(sorted_values)
+        if lower is not None:
+            side = "left" if inclusive in ("both", "left") else "right"
+            lo = np.searchsorted(sorted_values, lower, side=side)
+        if upper is not None:
+            side = "right" if inclusive in ("both", "right") else "left"
+            hi = np.searchsorted(sorted_values, upper, side=side)
+        return self.df.take(np.sort(order[lo:hi]))
+
+    def top_k(self, col, k, largest=True):
+        """
+        Same rows as `df.nlargest(k, col)` (or `nsmallest`): NaNs are
+        dropped and ties keep their original order.
+
+        Uses the cached permutation if there is one, otherwise a partition
+        around the k-th value (O(n)) and a sort of just the selected rows.
+        """
+        entry = self._fresh(col)
+        if entry is not None:
+            _, order, sorted_values = entry
+            order = order[: len(sorted_values)]
+            if largest:
+                order = _descending(order, sorted_values)
+            return self.df.take(order[:k])
+
+        values = self.df[col].to_numpy()
+        rows = np.flatnonzero(pd.notna(values))
+        values = values[rows]
+        k = min(k, len(values))
+        if k == 0:
+            return self.df.take(rows[:0])
+        # Everything strictly beyond the k-th value, then the earliest ties with it
+        if largest:
+            kth = np.partition(values, len(values) - k)[len(values) - k]
+            beyond = values > kth
+        else:
+            kth = np.partition(values, k - 1)[k - 1]
+            beyond = values < kth
+        ties = np.flatnonzero(values == kth)[: k - int(beyond.sum())]
+        picked = np.sort(np.concatenate([np.flatnonzero(beyond), ties]))
+        order = np.argsort(values[picked], kind="stable")
+        if largest:
+            order = _descending(order, values[picked][order])
+        return self.df.take(rows[picked[order]])
+
+
+def sorted_index_demo():
+    print("Sorted-Index Cache")
+
+    df = pd.DataFrame({
+        "name": ["Alice", "Bob", "Charlie", "Dan", "Eve"],
+        "age": [25, 30, 35, 28, 41],
+    })
+    index = SortedIndex(df)
+
+    print("Rows where age > 28:\n", index.between("age", lower=28, inclusive="neither"))
+    print("Sorted by age:\n", index.sort("age"))
+    print("Top 2 oldest:\n", index.top_k("age", 2))
+
+    df.loc[0, "age"] = 50   # write -> new buffer under copy-on-write -> cache rebuilds
+    print("After update, sorted by age:\n", index.sort("age"))
+    print("-" * 40)
+
+
 # Add/Update/Delete Columns
 def update_dataframe(df):
     print("Update DataFrame")
@@ -49,6 +288,106 @@ def update_dataframe(df):
     return df
 
 
+# Batched Column Mutations: plan add/update/drop, build the result once
+def mutate_columns(df, ops):
+    """
+    Apply a list of column operations and build the new frame in one step.
+
+    Each op is one of:
+        ("add", name, values)
+        ("update", name, values_or_func)   # func(columns) -> values
+        ("drop", name)
+
+    Callables get a dict of the columns as planned so far, so later ops can
+    use earlier results. Untouched columns are passed through without
+    copying; only new/updated columns allocate memory.
+
+    The result is deliberately left unconsolidated (roughly one block per
+    new/updated column): consolidating would copy every column of a dtype
+    into one block, i.e. a full-frame copy. Call `.copy()` on the result if
+    a consolidated layout is needed for row-wise access.
+    """
+    columns = {col: df[col] for col in df.columns}
+
+    for op in ops:
+        kind, name = op[0], op[1]
+        if kind == "drop":
+            if name not in columns:
+                raise KeyError(f"cannot drop missing column {name!r}")
+            del columns[name]
+            continue
+        if kind not in ("add", "update"):
+            raise ValueError(f"unknown column operation: {kind!r}")
+        if kind == "add" and name in columns:
+            raise ValueError(f"column {name!r} already exists")
+        if kind == "update" and name not in columns:
+            raise KeyError(f"cannot update missing column {name!r}")
+        values = op[2](columns) if callable(op[2]) else op[2]
+        columns[name] = pd.Series(values, index=df.index, name=name) \
+            if not isinstance(values, pd.Series) else values
+
+    return pd.DataFrame(columns, index=df.index, copy=False)   # no consolidation copy
+
+
+def batched_update_demo():
+    print("Batched Column Mutations")
+
+    df = pd.DataFrame({
+        "name": ["Alice", "Bob", "Charlie"],
+        "age": [25, 30, 35],
+        "city": ["Pune", "Mumbai", "Delhi"]
+    })
+
+    result = mutate_columns(df, [
+        ("add", "salary", [50000, 60000, 70000]),
+        ("update", "age", lambda cols: cols["age"] + 1),
+        ("add", "salary_k", lambda cols: cols["salary"] / 1000),
+        ("drop", "city"),
+    ])
+    print("Modified DataFrame:\n", result)
+    print("Original untouched:", list(df.columns))
+    print("-" * 40)
+
+
+def mutation_memory_profile(rows=1_000_000, width=20, updates=10):
+    """
+    Peak traced memory: per-op setitem/drop on a copy vs mutate_columns.
+    """
+    print(f"Mutation Memory Profile ({rows:,} rows x {width} float64 columns)")
+
+    df = pd.DataFrame({f"c{i}": np.arange(rows, dtype=np.float64) for i in range(width)})
+    frame_mb = df.memory_usage().sum() / 1e6
+    column_mb = rows * 8 / 1e6
+
+    def sequential():
+        out = df.copy()
+        for i in range(updates):
+            out[f"c{i}"] = out[f"c{i}"] + 1
+        out["new"] = 1.0
+        out.drop("c0", axis=1, inplace=True)
+        return out
+
+    def batched():
+        ops = [("update", f"c{i}", lambda cols, i=i: cols[f"c{i}"] + 1) for i in range(updates)]
+        ops += [("add", "new", np.ones(rows)), ("drop", "c0")]
+        return mutate_columns(df, ops)
+
+    for name, fn in [("copy + per-op", sequential), ("mutate_columns", batched)]:
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = fn()
+        seconds = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{name:<15} {seconds:6.3f}s  peak {peak / 1e6:8.1f} MB "
+              f"(frame {frame_mb:.0f} MB, {(peak / 1e6) / column_mb:.1f} columns' worth)")
+    assert sequential().equals(result)
+    last = f"c{width - 1}"
+    print("Untouched columns share memory:",
+          np.shares_memory(result[last].to_numpy(), df[last].to_numpy()))
+    print("-" * 40)
+
+
 # Aggregations
 def aggregation_demo(df):
     print("Aggregation")
@@ -59,6 +398,110 @@ def aggregation_demo(df):
     print("-" * 40)
 
 
+# One-Pass Aggregation: factorize the key once, bincount every column
+AGG_STATS = ("sum", "mean", "count", "min", "max", "std")
+
+
+def multi_aggregate(df, columns, stats=AGG_STATS, by=None):
+    """
+    Many reductions over many numeric columns, sharing one key factorization.
+
+    Sums and counts come from `np.bincount`, min/max from `reduceat` over a
+    single sort of the group codes. NaNs are skipped and `std` uses
+    ddof=1, like pandas. Without `by` the result has one row per stat;
+    with `by` it has one row per key and (column, stat) columns.
+    """
+    unknown = set(stats) - set(AGG_STATS)
+    if unknown:
+        raise ValueError(f"unsupported stats: {sorted(unknown)}")
+
+    if by is None:
+        codes = np.zeros(len(df), dtype=np.intp)
+        keys = pd.Index(["all"])
+    else:
+        codes, uniques = pd.factorize(df[by], sort=True)
+        valid = codes >= 0                       # drop NaN keys, like groupby
+        keys = pd.Index(uniques, name=by)
+        if not valid.all():
+            df, codes = df[valid], codes[valid]
+    groups = len(keys)
+
+    if "min" in stats or "max" in stats:
+        order = np.argsort(codes, kind="stable")
+        starts = np.searchsorted(codes[order], np.arange(groups))
+
+    result = {}
+    for col in columns:
+        x = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        present = ~np.isnan(x)
+        filled = np.where(present, x, 0.0)
+
+        count = np.bincount(codes, weights=present, minlength=groups)
+        total = np.bincount(codes, weights=filled, minlength=groups)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = total / count
+        out = {"sum": total, "mean": mean, "count": count.astype(np.int64)}
+
+        if "std" in stats:
+            dev = np.where(present, x - mean[codes], 0.0)
+            m2 = np.bincount(codes, weights=dev * dev, minlength=groups)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                out["std"] = np.sqrt(np.where(count > 1, m2 / (count - 1), np.nan))
+        if "min" in stats or "max" in stats:
+            sorted_x = x[order]
+            # fmin/fmax ignore NaN; an all-NaN group stays NaN
+            out["min"] = np.fmin.reduceat(sorted_x, starts) if len(x) else np.full(groups, np.nan)
+            out["max"] = np.fmax.reduceat(sorted_x, starts) if len(x) else np.full(groups, np.nan)
+
+        for stat in stats:
+            result[(col, stat)] = out[stat]
+
+    frame = pd.DataFrame(result, index=keys)
+    if by is None:
+        return frame.iloc[0].unstack().T.loc[list(stats), list(columns)]
+    return frame
+
+
+def multi_aggregate_demo(df):
+    print("One-Pass Multi-Column Aggregation")
+
+    overall = multi_aggregate(df, ["age", "salary"], stats=("mean", "sum", "count"))
+    print("Overall:\n", overall)
+    print("Mean age:", overall.loc["mean", "age"], "| Total salary:", overall.loc["sum", "salary"])
+    print("Group by age:\n", multi_aggregate(df, ["salary"], stats=("mean",), by="age"))
+    print("-" * 40)
+
+
+def aggregation_benchmark(rows=1_000_000, metrics=24, groups=1_000):
+    """
+    Chained per-column / per-stat calls vs one `multi_aggregate` call.
+    """
+    print(f"Aggregation Benchmark ({rows:,} rows, {metrics} metrics, {groups} groups)")
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({f"m{i}": rng.random(rows) for i in range(metrics)})
+    df["key"] = rng.integers(0, groups, rows)
+    columns = [f"m{i}" for i in range(metrics)]
+
+    def chained():
+        return {(col, stat): getattr(df.groupby("key")[col], stat)()
+                for col in columns for stat in AGG_STATS}
+
+    for name, fn in [
+        ("chained groupby calls", chained),
+        ("groupby().agg(list)", lambda: df.groupby("key")[columns].agg(list(AGG_STATS))),
+        ("multi_aggregate", lambda: multi_aggregate(df, columns, by="key")),
+    ]:
+        start = time.perf_counter()
+        fn()
+        print(f"{name:<22} {time.perf_counter() - start:8.3f}s")
+
+    expected = df.groupby("key")[columns].agg(list(AGG_STATS))
+    result = multi_aggregate(df, columns, by="key")
+    print("Matches groupby().agg:", np.allclose(result.to_numpy(), expected.to_numpy()))
+    print("-" * 40)
+
+
 # CSV & Excel I/O
 def io_demo():
     print("CSV / Excel I/O")
@@ -77,7 +520,110 @@ def io_demo():
     print("-" * 40)
 
 
+# Columnar I/O: Parquet keeps dtypes, reads only the columns / row groups asked for
+EXCEL_MAX_ROWS = 1_048_576
+
+
+def write_parquet(df, path, row_group_size=100_000):
+    """
+    Write `df` as Parquet; every row group stores min/max stats per column.
+    """
+    df.to_parquet(path, index=False, row_group_size=row_group_size)
+
+
+def read_parquet(path, columns=None, filters=None):
+    """
+    Read only `columns`, skipping row groups whose stats rule out `filters`.
+
+    `filters` uses the pyarrow form, e.g. [("price", ">", 35000)].
+    """
+    return pd.read_parquet(path, columns=columns, filters=filters)
+
+
+def parquet_io_demo():
+    print("Parquet I/O (columnar)")
+
+    if not HAS_PYARROW:
+        print("pyarrow not installed. Run: pip install pyarrow")
+        print("-" * 40)
+        return
+
+    df = pd.DataFrame({
+        "product": ["Laptop", "Phone", "Tablet"],
+        "price": [75000, 40000, 30000],
+        "launched": pd.to_datetime(["2023-01-10", "2023-06-01", "2024-02-15"])
+    })
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "products.parquet")
+        write_parquet(df, path)
+        loaded = read_parquet(path)
+        print("Parquet:\n", loaded)
+        print("Dtypes preserved:", loaded.dtypes.equals(df.dtypes))
+        print("Projected + filtered:\n",
+              read_parquet(path, columns=["product"], filters=[("price", ">", 35000)]))
+    print("-" * 40)
+
+
+def _timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def io_benchmark(sizes=(1_000_000, 10_000_000), include_excel=True):
+    """
+    Compare write time, read time and file size for CSV, Excel and Parquet.
+
+    Excel is skipped above its 1,048,576-row sheet limit.
+    """
+    print("I/O Benchmark: CSV vs Excel vs Parquet")
+
+    rng = np.random.default_rng(0)
+    products = np.array(["Laptop", "Phone", "Tablet", "Monitor", "Keyboard"])
+
+    for n in sizes:
+        df = pd.DataFrame({
+            "product": products[rng.integers(0, len(products), n)],
+            "price": rng.integers(1_000, 100_000, n),
+            "rating": rng.random(n) * 5,
+        })
+        print(f"{n:,} rows")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            formats = [
+                ("csv", lambda p: df.to_csv(p, index=False), pd.read_csv),
+            ]
+            if include_excel and n <= EXCEL_MAX_ROWS - 1:
+                formats.append(("xlsx", lambda p: df.to_excel(p, index=False), pd.read_excel))
+            if HAS_PYARROW:
+                formats.append(("parquet", lambda p: write_parquet(df, p), read_parquet))
+
+            for ext, write, read in formats:
+                path = os.path.join(tmp, f"bench.{ext}")
+                write_s, _ = _timed(write, path)
+                read_s, _ = _timed(read, path)
+                size_mb = os.path.getsize(path) / 1e6
+                print(f"  {ext:<8} write {write_s:8.3f}s  read {read_s:8.3f}s  size {size_mb:9.2f} MB")
+
+            if HAS_PYARROW:
+                path = os.path.join(tmp, "bench.parquet")
+                read_s, part = _timed(read_parquet, path, columns=["price"],
+                                      filters=[("price", ">", 95_000)])
+                print(f"  parquet projected + filtered read {read_s:.3f}s ({len(part):,} rows)")
+    print("-" * 40)
+
+
 # ML Use Case: Read CSV, preprocess
+def preprocess_features(df, column="feature1"):
+    """
+    Fill NaNs with 0 and scale `column` by its max (in place).
+    """
+    df.fillna(0, inplace=True)        # Fill NaNs
+    df[column] = df[column] / df[column].max()  # Normalize
+    return df
+
+
 def ml_pipeline_csv():
     print("ML Example: Clean data from CSV")
 
@@ -89,22 +635,123 @@ def ml_pipeline_csv():
 
     print("Original:\n", df)
 
-    df.fillna(0, inplace=True)        # Fill NaNs
-    df["feature1"] = df["feature1"] / df["feature1"].max()  # Normalize
+    preprocess_features(df)
     print("Processed:\n", df)
     print("-" * 40)
 
 
+# Out-of-core version: two passes over read_csv(chunksize=...)
+def csv_column_stats(path, chunksize=100_000):
+    """
+    Pass one: collect per-column min / max / NaN count without loading the file.
+
+    Also records whether a column ever came back as text or float in any
+    chunk, so pass two can give every chunk the dtype the whole file would get.
+    """
+    stats = {}
+    for chunk in pd.read_csv(path, chunksize=chunksize):
+        for col in chunk.columns:
+            s = chunk[col]
+            st = stats.setdefault(col, {"min": None, "max": None, "nans": 0,
+                                        "numeric": True, "float": False})
+            nans = int(s.isna().sum())
+            st["nans"] += nans
+            if nans == len(s):
+                continue                  # all-NaN chunk says nothing about the dtype
+            if not pd.api.types.is_numeric_dtype(s) or pd.api.types.is_bool_dtype(s):
+                st["numeric"] = False
+                continue
+            st["float"] = st["float"] or pd.api.types.is_float_dtype(s)
+            lo, hi = s.min(), s.max()
+            st["min"] = lo if st["min"] is None else min(st["min"], lo)
+            st["max"] = hi if st["max"] is None else max(st["max"], hi)
+    return stats
+
+
+def ml_pipeline_csv_in_memory(src, dst, column="feature1"):
+    """
+    Reference path: whole file in memory.
+    """
+    df = pd.read_csv(src)
+    preprocess_features(df, column)
+    df.to_csv(dst, index=False)
+
+
+def ml_pipeline_csv_chunked(src, dst, column="feature1", chunksize=100_000):
+    """
+    Same output as `ml_pipeline_csv_in_memory`, but peak memory is one chunk.
+
+    Pass one collects column stats, pass two fills, normalizes and appends
+    each chunk to `dst`.
+    """
+    stats = csv_column_stats(src, chunksize)
+
+    st = stats[column]
+    if not st["numeric"]:
+        raise TypeError(f"Column {column!r} is not numeric")
+    # fillna(0) runs before max(), so a NaN anywhere makes 0 a candidate
+    col_max = st["max"]
+    if st["nans"]:
+        col_max = 0 if col_max is None else max(col_max, 0)
+
+    # Text columns are read as text in every chunk, so a chunk that happens
+    # to look numeric ("1.50") isn't parsed and rewritten as 1.5
+    text = {col: object for col, cs in stats.items() if not cs["numeric"]}
+    floats = [col for col, cs in stats.items()
+              if cs["numeric"] and (cs["float"] or cs["nans"])]
+
+    header = True
+    with open(dst, "w", newline="") as out:
+        for chunk in pd.read_csv(src, chunksize=chunksize, dtype=text):
+            for col in floats:
+                chunk[col] = chunk[col].astype("float64")
+            chunk.fillna(0, inplace=True)
+            chunk[column] = chunk[column] / col_max
+            chunk.to_csv(out, index=False, header=header)
+            header = False
+    return stats
+
+
+def ml_pipeline_chunked_demo():
+    print("ML Example: Chunked (out-of-core) CSV preprocessing")
+
+    df = pd.DataFrame({
+        "feature1": [1, 2, None, 4, 5, None, 7, 8],
+        "feature2": [10, None, 30, 40, 50, 60, 70, 80],
+        "label": ["A", "B", "A", "B", "B", "A", "B", "A"]
+    })
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "features.csv")
+        df.to_csv(src, index=False)
+
+        in_memory = os.path.join(tmp, "in_memory.csv")
+        chunked = os.path.join(tmp, "chunked.csv")
+        ml_pipeline_csv_in_memory(src, in_memory)
+        ml_pipeline_csv_chunked(src, chunked, chunksize=3)
+
+        with open(in_memory, "rb") as a, open(chunked, "rb") as b:
+            print("Byte-identical output:", a.read() == b.read())
+        print("Processed (chunked):\n", pd.read_csv(chunked))
+    print("-" * 40)
+
+
 def main():
     """
     Run all Pandas basics
     """
     df = create_basics()
+    compact_create_demo()
     indexing_filtering(df)
+    sorted_index_demo()
     df = update_dataframe(df)
+    batched_update_demo()
     aggregation_demo(df)
+    multi_aggregate_demo(df)
     io_demo()
+    parquet_io_demo()
     ml_pipeline_csv()
+    ml_pipeline_chunked_demo()
 
 
 if __name__ == "__main__":